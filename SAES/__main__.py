@@ -1,16 +1,64 @@
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 import argparse
+import os
 
-from SAES.latex_generation.stats_table import MeanMedian
-from SAES.latex_generation.stats_table import Friedman
-from SAES.latex_generation.stats_table import WilcoxonPivot
-from SAES.latex_generation.stats_table import Wilcoxon
+import pandas as pd
 
-from SAES.plots.boxplot import Boxplot
-from SAES.plots.cdplot import CDplot
+# The plotting and statistical modules are slow to import (matplotlib, scipy), so they are
+# imported only by the options that use them
 
-from SAES.multiobjective.pareto_front import Front2D
-from SAES.multiobjective.pareto_front import Front3D
-from SAES.multiobjective.pareto_front import FrontND
+# Names of the LaTeX table classes in SAES.latex_generation.stats_table
+LATEX_TABLES = {
+    'mean_median': 'MeanMedian',
+    'friedman': 'Friedman',
+    'wilcoxon_pivot': 'WilcoxonPivot',
+    'wilcoxon': 'Wilcoxon'
+}
+
+def _save_latex(metric: str, data: pd.DataFrame, metrics: pd.DataFrame, table: str, output_path: str) -> None:
+    """Generates the LaTeX table of the given type for a metric and saves it."""
+    from SAES.latex_generation import stats_table
+    getattr(stats_table, LATEX_TABLES[table])(data, metrics, metric).save(output_path)
+
+def _save_boxplot(metric: str, data: pd.DataFrame, metrics: pd.DataFrame, instance: str, output_path: str) -> None:
+    """Generates the boxplot of an instance of a metric and saves it."""
+    from SAES.plots.boxplot import Boxplot
+    Boxplot(data, metrics, metric).save_instance(instance, output_path)
+
+def _save_boxplots(metric: str, data: pd.DataFrame, metrics: pd.DataFrame, output_path: str) -> None:
+    """Generates the boxplots of all the instances of a metric in grid format and saves them."""
+    from SAES.plots.boxplot import Boxplot
+    Boxplot(data, metrics, metric).save_all_instances(output_path)
+
+def _save_cdplot(metric: str, data: pd.DataFrame, metrics: pd.DataFrame, output_path: str) -> None:
+    """Generates the critical distance plot for a metric and saves it."""
+    from SAES.plots.cdplot import CDplot
+    CDplot(data, metrics, metric).save(output_path)
+
+def _save_front(metric: str, fronts_path: str, references_path: str, dimensions: str, instance: str, output_path: str) -> None:
+    """Generates the Pareto fronts of an instance for the given number of dimensions and saves them."""
+    from SAES.multiobjective.pareto_front import Front2D, Front3D, FrontND
+    if dimensions == '2':
+        Front2D(fronts_path, references_path, metric).save(instance, output_path)
+    elif dimensions == '3':
+        Front3D(fronts_path, references_path, metric).save(instance, output_path)
+    else:
+        FrontND(fronts_path, references_path, metric, dimensions).save(instance, output_path)
+
+def _run_all_metrics(function, data: pd.DataFrame, **kwargs) -> None:
+    """Runs the given function for every metric in the dataset, one worker process per metric."""
+
+    # Split the dataset by metric in one pass, so each worker only receives the rows of its metric
+    metric_names, metric_data = zip(*data.groupby("MetricName", sort=False, observed=True))
+
+    # A single metric is run in this process, starting a worker pool for it would only add overhead
+    if len(metric_names) == 1:
+        function(metric_names[0], metric_data[0], **kwargs)
+        return
+
+    with ProcessPoolExecutor(max_workers=min(len(metric_names), os.cpu_count() or 1)) as executor:
+        list(executor.map(partial(function, **kwargs), metric_names, metric_data))
 
 def main():
     # Create the argument parser object
@@ -30,7 +78,7 @@ def main():
     parser.add_argument('-r', required=False, type=str, help='Path to the Pareto Fronts references csv. Works only for --fr')
 
     # Add optional arguments for more specific settings
-    parser.add_argument('-m', type=str, help='Specify the metric to be used to generate the results. Works for the three features')
+    parser.add_argument('-m', type=str, help='Specify the metric to be used to generate the results. Works for the three features. If omitted with --ls, --bp or --cdp, all the metrics are processed')
     parser.add_argument('-i', type=str, help='Specify the instance to be used to generate the results. Works only for --bp')
     parser.add_argument(
         '-s', 
@@ -39,19 +87,30 @@ def main():
         help='Specify the type of LaTeX report to be generated (works only for --ls)'
     )
     parser.add_argument('-op', type=str, help='Specify the output path for the generated files. Works for the three features')
-    parser.add_argument('-g', action='store_true', help='Choose to generate all the boxplots for a specific metric in grid format. Works only for --bp')
+    parser.add_argument('-g', action='store_true', help='Choose to generate all the boxplots for a specific metric in grid format (the default when no instance is given). Works only for --bp')
     parser.add_argument('-d', type=str, help='Choose the number of dimensions for the Pareto Fronts. Works only for --fr')
 
     # Parse the command-line arguments
     args = parser.parse_args()
 
+    # The plots are only saved to files, so render them without a GUI backend unless the user chose one (the
+    # worker processes inherit the environment variable too)
+    os.environ.setdefault("MPLBACKEND", "Agg")
+
     BOXPLOT = args.bp
     LATEX = args.ls
     CDPLOT = args.cdp
     FRONT = args.fr
 
-    DATA = args.ds
-    METRICS = args.ms
+    # Load the dataset and metrics CSV files once, they are shared by every table and plot
+    if not FRONT:
+        from SAES.utils.dataframe_processor import read_csv
+        DATA, METRICS = read_csv(args.ds), read_csv(args.ms)
+
+        # Encode the metric names as categories so that selecting the rows of a metric compares integer codes
+        DATA["MetricName"] = DATA["MetricName"].astype("category")
+    else:
+        DATA, METRICS = args.ds, args.ms
     PFRONTS = args.pf
     REFERENCES = args.r
 
@@ -64,44 +123,32 @@ def main():
 
     # Boxplot generation
     if BOXPLOT:
-        boxplot = Boxplot(DATA, METRICS, METRIC)
-        if METRIC and GRID and not INSTANCE:
-            boxplot.save_all_instances(OUTPUT)
-        elif METRIC and not GRID and INSTANCE:
-            boxplot.save_instance(INSTANCE, OUTPUT)
+        if METRIC and not GRID and INSTANCE:
+            _save_boxplot(METRIC, DATA, METRICS, INSTANCE, OUTPUT)
+        elif METRIC and not INSTANCE:
+            _save_boxplots(METRIC, DATA, METRICS, OUTPUT)
+        elif not INSTANCE:
+            _run_all_metrics(_save_boxplots, DATA, metrics=METRICS, output_path=OUTPUT)
         else:
             parser.error("Please specify a metric and an instance to generate the boxplot")
     # LaTeX report generation
     elif LATEX:
-        if TABLE and METRIC:
-            if TABLE == 'mean_median':
-                MeanMedian(DATA, METRICS, METRIC).save(OUTPUT)
-            elif TABLE == 'friedman':
-                Friedman(DATA, METRICS, METRIC).save(OUTPUT)
-            elif TABLE == 'wilcoxon_pivot':
-                WilcoxonPivot(DATA, METRICS, METRIC).save(OUTPUT)
-            elif TABLE == 'wilcoxon':
-                Wilcoxon(DATA, METRICS, METRIC).save(OUTPUT)
-            else:
-                parser.error("Please specify a valid type of LaTeX report to be generated")
-        else:
+        if TABLE not in LATEX_TABLES:
             parser.error("Please specify the type of LaTeX report to be generated")
+        elif METRIC:
+            _save_latex(METRIC, DATA, METRICS, TABLE, OUTPUT)
+        else:
+            _run_all_metrics(_save_latex, DATA, metrics=METRICS, table=TABLE, output_path=OUTPUT)
     # Critical Distance Plot generation
     elif CDPLOT:
-        cdplot = CDplot(DATA, METRICS, METRIC)
         if METRIC:
-            cdplot.save(OUTPUT)
+            _save_cdplot(METRIC, DATA, METRICS, OUTPUT)
         else:
-            parser.error("Please specify a metric to generate the critical distance plot")
+            _run_all_metrics(_save_cdplot, DATA, metrics=METRICS, output_path=OUTPUT)
     # Pareto Fronts generation
     elif FRONT:
         if PFRONTS and REFERENCES and INSTANCE and METRIC:
-            if DIMENSIONS == '2':
-                Front2D(PFRONTS, REFERENCES, METRIC).save(INSTANCE, OUTPUT)
-            elif DIMENSIONS == '3':
-                Front3D(PFRONTS, REFERENCES, METRIC).save(INSTANCE, OUTPUT)
-            else:
-                FrontND(PFRONTS, REFERENCES, METRIC, DIMENSIONS).save(INSTANCE, OUTPUT)
+            _save_front(METRIC, PFRONTS, REFERENCES, DIMENSIONS, INSTANCE, OUTPUT)
         else:
             parser.error("Please specify the paths to the Pareto Fronts and References CSV files")
     else:
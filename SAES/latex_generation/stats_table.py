@@ -4,9 +4,14 @@ from SAES.statistical_tests.parametrical import t_test, anova
 from SAES.utils.dataframe_processor import check_normality
 from SAES.logger import get_logger
 
+from concurrent.futures import ProcessPoolExecutor
 from abc import ABC, abstractmethod
+from functools import cached_property, lru_cache, partial, reduce, wraps
+from pathlib import Path
+import multiprocessing
 import pandas as pd
 import numpy as np
+import jinja2
 import os
 
 # Article reference: https://www.statology.org/friedman-test-python/
@@ -18,15 +23,286 @@ friedman_tests = {
     "quade": quade
 }
 
-def _highlight_max(table: pd.DataFrame):
-    """Highlight the maximum value in each row."""
-    is_max = table[:-1] == table[:-1].max() 
-    return ['background-color: green' if v else '' for v in is_max] + ['']
+# Number of pairwise tests from which the 1vs1 tables run them in worker processes
+PARALLEL_MIN_TESTS = 5000
 
-def _highlight_min(table: pd.DataFrame):
-    """Highlight the minimum value in each row."""
-    is_min = table[:-1] == table[:-1].min() 
-    return ['background-color: green' if v else '' for v in is_min] + ['']
+_LATEX_PREAMBLE = """
+        \\documentclass{article}
+        \\title{Algorithms Comparison}
+        \\usepackage{colortbl}
+        \\usepackage{float}
+        \\usepackage{rotating}
+        \\usepackage[table*]{xcolor}
+        \\usepackage{tabularx}
+        \\usepackage{siunitx}
+        \\sisetup{output-exponent-marker=\\text{e}}
+        \\xdefinecolor{gray95}{gray}{0.65}
+        \\xdefinecolor{gray25}{gray}{0.8}
+        \\author{YourName}
+        \\begin{document}
+        \\maketitle
+        \\section{Tables}"""
+
+_LATEX_POSTAMBLE = """
+        \\end{document}
+        """
+
+# Opening and closing of the table environment, keyed by the sideways flag
+_LATEX_TABLE_BEGIN = {True: "\\begin{sidewaystable}", False: "\\begin{table}[H]"}
+_LATEX_TABLE_END = {True: "\\end{sidewaystable}", False: "\\end{table}"}
+
+_LATEX_TABULAR_END = """
+        \\end{tabular}
+        \\end{scriptsize}
+        """
+
+# Caption and tabular opening of every table, filled once per table with str.format_map
+_LATEX_HEADER = """{lead}
+        \\caption{{{metric}.  {caption}}}
+        \\vspace{{1mm}}
+        \\centering
+        \\begin{{scriptsize}}
+        \\begin{{tabular}}{{l|{columns}}}
+        \\hline
+        & {names} \\\\ \\hline
+"""
+
+# Explanations added to the captions of the tables with test results
+_SIGNIFICANCE_NOTE = " (+ implies that the difference between the algorithms for the instance in the select row is significant)\n"
+_PIVOT_NOTE = (" (- implies that the pivot algorithm (last column) is statistically "
+               "worse, = indicates that the differences are not significant.)\n")
+_PAIRWISE_NOTE = (". Each symbol in the cells represents a problem. Symbol - indicates that the row "
+                  "algorithm performs worse with statistical confidence;  symbol = implies that "
+                  "the differences are not significant.")
+
+# Colours of the cells of the best and second best algorithms of an instance
+_CELL_BEST = "\\cellcolor{gray95}"
+_CELL_SECOND = "\\cellcolor{gray25}"
+
+# Rows of a tabular, one list of cells per row, compiled once
+_LATEX_ROWS = jinja2.Environment(autoescape=False).from_string(
+    "{% for row in rows %}{{ row | join(' & ') }} \\\\ \n{% endfor %}"
+)
+
+@lru_cache(maxsize=None)
+def _ensure_dir(path: str) -> None:
+    """Creates the output directory, only once per path."""
+    os.makedirs(path, exist_ok=True)
+
+class _MetricContext:
+    """The processed data of a metric, along with the results computed from it by the `_context_cached` functions."""
+
+    def __init__(self, data: pd.DataFrame, maximize: bool, algorithms: np.ndarray, instances: np.ndarray):
+        self.data, self.maximize, self.algorithms, self.instances = data, maximize, algorithms, instances
+        self.results = {}
+
+def _metric_context(data: str | pd.DataFrame, metrics: str | pd.DataFrame, metric: str) -> _MetricContext:
+    """Processes the data of a metric and returns its context with the data, maximize flag, algorithms and instances."""
+
+    data, maximize = process_dataframe_metric(data, metrics, metric)
+    algorithms, instances = data['Algorithm'].unique(), data['Instance'].unique()
+
+    # Encode the algorithm and instance names once, keeping their order of appearance, so grouping them is cheap
+    data = data.assign(
+        Algorithm=pd.Categorical(data['Algorithm'], categories=algorithms),
+        Instance=pd.Categorical(data['Instance'], categories=instances)
+    )
+    return _MetricContext(data, maximize, algorithms, instances)
+
+@lru_cache(maxsize=16)
+def _load_metric_context(data: str, data_mtime: int, metrics: str, metrics_mtime: int, metric: str) -> _MetricContext:
+    """Cached version of `_metric_context` for CSV paths, keyed on the paths and their modification times."""
+    return _metric_context(data, metrics, metric)
+
+def _context_cached(function):
+    """
+    Caches the results of a function of a metric context in the context itself, so they are shared by the tables 
+    built on it and dropped along with it. The arguments are keyed with their types, since the tests rank differently 
+    for a numpy boolean than for a Python one (`maximize is False`).
+    """
+
+    @wraps(function)
+    def cached(context: _MetricContext, *args):
+        key = (function.__name__, args, tuple(type(arg) for arg in args))
+        if key not in context.results:
+            context.results[key] = function(context, *args)
+        return context.results[key]
+
+    return cached
+
+@_context_cached
+def _normality(context: _MetricContext) -> bool:
+    """Cached normality check of the data of a metric context."""
+    return check_normality(context.data)
+
+def _positions(values: pd.Series | pd.Index, labels: tuple) -> np.ndarray:
+    """Returns the position of every value in the labels (-1 if missing), using the category codes when available."""
+
+    values = pd.Index(values)
+    if not isinstance(values, pd.CategoricalIndex):
+        return pd.Index(labels).get_indexer(values)
+
+    # Look up the categories only and map the codes through them (the code -1 of missing values stays -1)
+    return np.append(pd.Index(labels).get_indexer(values.categories), -1)[values.codes]
+
+def _grid(grouped: pd.Series, algorithms: tuple, instances: tuple) -> pd.DataFrame:
+    """Places a Series indexed by (Instance, Algorithm) into an (instances x algorithms) table, without unstacking it."""
+
+    rows = _positions(grouped.index.get_level_values(0), instances)
+    columns = _positions(grouped.index.get_level_values(1), algorithms)
+
+    grid = np.full((len(instances), len(algorithms)), np.nan)
+    grid[rows, columns] = grouped.to_numpy(dtype=np.float64)
+
+    # Plain labels, since a categorical index would reject the columns added by the tables
+    return pd.DataFrame(grid, index=pd.Index(instances), columns=pd.Index(algorithms))
+
+@_context_cached
+def _base_tables(context: _MetricContext, normal: bool, algorithms: tuple, instances: tuple) -> tuple:
+    """Computes the mean/median and std/iqr tables of the data of a metric context."""
+
+    grouped = context.data.groupby(['Instance', 'Algorithm'], observed=True)['MetricValue']
+    if normal:
+        mean_median, std_iqr = grouped.mean(), grouped.std()
+    else:
+        # The three quartiles in a single pass, the second one being the median
+        quartiles = grouped.quantile([0.25, 0.5, 0.75])
+        mean_median = quartiles.xs(0.5, level=-1)
+        std_iqr = quartiles.xs(0.75, level=-1) - quartiles.xs(0.25, level=-1)
+
+    return _grid(mean_median, algorithms, instances), _grid(std_iqr, algorithms, instances)
+
+@_context_cached
+def _top_two(context: _MetricContext, normal: bool, maximize: bool, algorithms: tuple, instances: tuple) -> np.ndarray:
+    """
+    Ranks the algorithms of every instance of the base tables in one pass, returning an (instances x 2) array with 
+    the positions of the best and second best algorithms.
+    """
+
+    mean_median, std_iqr = _base_tables(context, normal, algorithms, instances)
+    mean_median, std_iqr = mean_median.to_numpy(), std_iqr.to_numpy()
+
+    # Default to mean/median for ranking, keeping the first algorithm on ties (NaN values are sorted last)
+    top_two = np.argsort(-mean_median if maximize else mean_median, axis=1, kind="stable")[:, :2]
+
+    # If there's a tie, use std/iqr to decide
+    rows = np.arange(len(instances))
+    ties = mean_median[rows, top_two[:, 0]] == mean_median[rows, top_two[:, 1]]
+    top_two[ties] = np.argsort(std_iqr[ties], axis=1, kind="stable")[:, :2]
+
+    top_two.flags.writeable = False
+    return top_two
+
+@_context_cached
+def _instance_values(context: _MetricContext, algorithms: tuple, instances: tuple) -> np.ndarray:
+    """Pivots the metric values of a metric context into an (instances, executions, algorithms) array."""
+
+    data = context.data
+    executions = data['ExecutionId'].unique()
+    shape = (len(instances), len(executions), len(algorithms))
+
+    # Position of every row in the (instances, executions, algorithms) array
+    positions = np.ravel_multi_index((
+        _positions(data['Instance'], instances),
+        _positions(data['ExecutionId'], executions),
+        _positions(data['Algorithm'], algorithms)
+    ), shape)
+
+    if np.bincount(positions, minlength=np.prod(shape)).max(initial=0) > 1:
+        raise ValueError("Each algorithm must have a single metric value per instance and execution.")
+
+    values = np.full(np.prod(shape), np.nan)
+    values[positions] = data['MetricValue'].to_numpy(dtype=np.float64)
+    values = values.reshape(shape)
+    values.flags.writeable = False
+    return values
+
+@_context_cached
+def _instance_tables(context: _MetricContext, algorithms: tuple, instances: tuple) -> dict:
+    """Splits the instance array of a metric context into one (executions x algorithms) array per instance."""
+
+    tables = {}
+    for instance, values in zip(instances, _instance_values(context, algorithms, instances)):
+        # Executions missing for every algorithm are not part of the instance
+        tables[instance] = values[~np.isnan(values).all(axis=1)]
+        tables[instance].flags.writeable = False
+    return tables
+
+def _map_tests(function, items: list, n_tests: int) -> list:
+    """Maps the function over the items, in worker processes once there are PARALLEL_MIN_TESTS tests to run."""
+
+    # The items are independent, so large comparisons spread them over worker processes, unless this already runs in 
+    # one (e.g. a metric of the CLI), since nested pools would start more processes than there are CPUs
+    if n_tests >= PARALLEL_MIN_TESTS and len(items) > 1 and multiprocessing.parent_process() is None:
+        # Run the first item here, so data the tests cannot handle fails before any worker process is started
+        first = function(items[0])
+        cpus = os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=min(len(items) - 1, cpus)) as executor:
+            return [first] + list(executor.map(function, items[1:], chunksize=max(1, (len(items) - 1) // cpus)))
+
+    return list(map(function, items))
+
+def _friedman_p_value(table: np.ndarray, friedman_test: str, maximize: bool) -> float:
+    """Runs one of the `friedman_tests` on the (executions x algorithms) array of an instance and returns the p-value."""
+    return friedman_tests[friedman_test](table, maximize)["Results"]["p-value"]
+
+def _pair_results(pair_tables: list, test, maximize: bool) -> list:
+    """Runs the pairwise test on the (executions x 2) array of every instance."""
+    return [test(pair_table, maximize) for pair_table in pair_tables]
+
+@_context_cached
+def _friedman_p_values(context: _MetricContext, algorithms: tuple, instances: tuple, friedman_test: str, maximize: bool) -> np.ndarray:
+    """Runs one of the `friedman_tests` on every instance of a metric context and returns the p-values."""
+
+    instance_tables = _instance_tables(context, algorithms, instances)
+    p_values = np.array(_map_tests(
+        partial(_friedman_p_value, friedman_test=friedman_test, maximize=maximize),
+        [instance_tables[instance] for instance in instances], len(instances)
+    ), dtype=float)
+    p_values.flags.writeable = False
+    return p_values
+
+@_context_cached
+def _pivot_results(context: _MetricContext, algorithms: tuple, instances: tuple, test, maximize: bool) -> np.ndarray:
+    """Compares every algorithm against the pivot (last one) on every instance of a metric context."""
+
+    instance_tables = _instance_tables(context, algorithms, instances)
+    pair_tables = [[instance_tables[instance][:, [-1, j]] for instance in instances] for j in range(len(algorithms) - 1)]
+    results = _map_tests(partial(_pair_results, test=test, maximize=maximize), pair_tables, len(pair_tables) * len(instances))
+
+    # The pivot column (last one) has no test result
+    test_results = np.full((len(instances), len(algorithms)), '', dtype=object)
+    for j, column in enumerate(results):
+        test_results[:, j] = column
+
+    test_results.flags.writeable = False
+    return test_results
+
+@_context_cached
+def _pairwise_results(context: _MetricContext, algorithms: tuple, instances: tuple, test, maximize: bool) -> dict:
+    """Runs the pairwise test on every pair of algorithms of a metric context, keyed by the pair positions."""
+
+    instance_tables = _instance_tables(context, algorithms, instances)
+    pairs = [(i, j) for i in range(len(algorithms) - 1) for j in range(i + 1, len(algorithms))]
+    pair_tables = [[instance_tables[instance][:, [i, j]] for instance in instances] for i, j in pairs]
+    results = _map_tests(partial(_pair_results, test=test, maximize=maximize), pair_tables, len(pairs) * len(instances))
+
+    return {pair: "".join(result) for pair, result in zip(pairs, results)}
+
+def _highlight(table: pd.DataFrame, best: pd.Series) -> pd.DataFrame:
+    """Styles the cells equal to the best value of their row, leaving the last column unstyled."""
+
+    values = table.iloc[:, :-1]
+    styles = np.where(values.eq(best, axis=0), 'background-color: green', '')
+    return pd.DataFrame(np.column_stack([styles, np.full(len(table), '')]), index=table.index, columns=table.columns)
+
+def _highlight_max(table: pd.DataFrame) -> pd.DataFrame:
+    """Highlight the maximum value in each row, for all the rows at once."""
+    return _highlight(table, table.iloc[:, :-1].max(axis=1))
+
+def _highlight_min(table: pd.DataFrame) -> pd.DataFrame:
+    """Highlight the minimum value in each row, for all the rows at once."""
+    return _highlight(table, table.iloc[:, :-1].min(axis=1))
 
 class Table(ABC):
     """
@@ -95,7 +371,8 @@ class Table(ABC):
 
         Args:
             data (str | pd.DataFrame):
-                Path to CSV file or a DataFrame containing data.
+                Path to CSV file or a DataFrame containing data. The data of CSV files is processed once per metric
+                (and version of the files) and shared by the tables built from them.
 
             metrics (str | pd.DataFrame):
                 Path to CSV file or a DataFrame containing metric information.
@@ -118,19 +395,44 @@ class Table(ABC):
             >>> table = MeanMedian(data, metrics, metric)
         """
 
-        self.data, self.maximize = process_dataframe_metric(data, metrics, metric)
+        # The data of CSV files is processed once per metric and shared by all the tables built from it, while
+        # DataFrames are processed again for every table, since they may have been modified in place in between
+        if isinstance(data, str) and isinstance(metrics, str):
+            context = _load_metric_context(data, os.stat(data).st_mtime_ns, metrics, os.stat(metrics).st_mtime_ns, metric)
+        else:
+            context = _metric_context(data, metrics, metric)
+
+        self._context = context
+        self.data, self.maximize, self.algorithms, self.instances = (
+            context.data, context.maximize, context.algorithms, context.instances
+        )
         self.metric = metric
-        self.normality = check_normality(self.data)
         self.normal = normal
-        self.algorithms = self.data['Algorithm'].unique()
-        self.instances = self.data['Instance'].unique()
 
         self.mean_median = None
         self.std_iqr = None
         self.table = None
-        self.latex_doc = None
+        self._parts = []
         self.logger = get_logger(__name__)
 
+    @property
+    def latex_doc(self) -> str:
+        """The LaTeX document of the table, or None if it has not been created yet."""
+
+        # Join the parts once and keep the result as the only part
+        if len(self._parts) > 1:
+            self._parts = ["".join(self._parts)]
+        return self._parts[0] if self._parts else None
+
+    @latex_doc.setter
+    def latex_doc(self, latex_doc: str) -> None:
+        self._parts = [] if latex_doc is None else [latex_doc]
+
+    @cached_property
+    def normality(self) -> bool:
+        """Whether the data is normally distributed, checked on first access only since most tables never need it."""
+        return _normality(self._context)
+
     def compute_base_table(self) -> None:
         """
         Computes the base table with mean/median and standard deviation/interquartile range values.
@@ -145,24 +447,46 @@ class Table(ABC):
             >>> table.compute_base_table()
         """
 
-        if self.normal:
-            grouped = self.data.groupby(['Instance', 'Algorithm'])['MetricValue'].agg(['mean', 'std'])
-            self.mean_median, self.std_iqr = grouped['mean'], grouped['std']
-        else:
-            grouped = self.data.groupby(['Instance', 'Algorithm'])['MetricValue'].agg(
-                median='median', Q1=lambda x: x.quantile(0.25), Q3=lambda x: x.quantile(0.75)
-            )
-            self.mean_median, self.std_iqr = grouped['median'], grouped['Q3'] - grouped['Q1']
-
-        self.mean_median = self.mean_median.unstack()
-        self.std_iqr = self.std_iqr.unstack()
+        # The cached tables are shared by every Table built on the same data, so each table works on its own copies
+        mean_median, std_iqr = _base_tables(self._context, self.normal, tuple(self.algorithms), tuple(self.instances))
+        self.mean_median, self.std_iqr = mean_median.copy(), std_iqr.copy()
 
-        self.mean_median = self.mean_median[self.algorithms].reindex(self.instances)
-        self.std_iqr = self.std_iqr[self.algorithms].reindex(self.instances)
+        # Format all the values at once (as "{:.2e}") for the rows of the LaTeX tables
+        self._mean_median_strings = np.char.mod("%.2e", self.mean_median.to_numpy())
+        self._std_iqr_strings = np.char.mod("%.2e", self.std_iqr.to_numpy())
 
-        self.mean_median.index.name, self.mean_median.columns.name = None, None
-        self.std_iqr.index.name, self.std_iqr.columns.name = None, None
+        # Column layout and names of the algorithm columns, shared by the headers of the LaTeX tables
+        self._column_spec = "c|" * (len(self.algorithms) - 1) + "c"
+        self._algorithm_header = " & ".join(self.algorithms)
     
+    def instance_values(self) -> np.ndarray:
+        """
+        Returns the metric values as an array of shape (instances, executions, algorithms), following the order of 
+        `self.instances` and `self.algorithms`. Missing executions are filled with NaN.
+
+        Example:
+            >>> from SAES.latex_generation.stats_table import WilcoxonPivot
+            >>>
+            >>> data = pd.read_csv("data.csv")
+            >>> metrics = pd.read_csv("metrics.csv")
+            >>> metric = "HV"
+            >>> table = WilcoxonPivot(data, metrics, metric)
+            >>> values = table.instance_values()
+        """
+
+        # The array is shared by every Table built on the same data, so it is read-only
+        return _instance_values(self._context, tuple(self.algorithms), tuple(self.instances))
+
+    def _friedman_p_values(self, friedman_test: str) -> np.ndarray:
+        """Returns the p-values of the given Friedman test on every instance, shared by the tables built on the same data."""
+        return _friedman_p_values(
+            self._context, tuple(self.algorithms), tuple(self.instances), friedman_test, self.maximize
+        )
+
+    def _instance_tables(self) -> dict:
+        """Returns the (executions x algorithms) array of metric values of every instance, without missing executions."""
+        return _instance_tables(self._context, tuple(self.algorithms), tuple(self.instances))
+
     def save(self, output_path: str, file_name: str = None, sideways: bool = False) -> None:
         """
         Saves the table to a LaTeX file.
@@ -193,16 +517,25 @@ class Table(ABC):
 
         # Create the LaTeX table
         self.create_latex_table(sideways=sideways)
-        os.makedirs(output_path, exist_ok=True)
+        _ensure_dir(output_path)
 
         file_name = file_name if file_name else f"{self.__str__()}_{self.metric}.tex"
 
-        # Save the LaTeX table to a file
-        with open(f"{output_path}/{file_name}", "w") as f:
-            f.write(self.latex_doc)
+        # Stream the parts of the LaTeX table to the file, without joining them into one string
+        try:
+            self._write_parts(Path(output_path, file_name))
+        except FileNotFoundError:
+            # The directory was removed after being created by a previous call
+            os.makedirs(output_path, exist_ok=True)
+            self._write_parts(Path(output_path, file_name))
 
         self.logger.info(f"{file_name} table saved to {output_path}")
 
+    def _write_parts(self, path: Path) -> None:
+        """Writes the parts of the LaTeX document to the given file through a large buffer."""
+        with open(path, "w", buffering=1 << 20) as file:
+            file.writelines(self._parts)
+
     def create_latex_table(self, sideways: bool = False) -> None:
         """
         Computes the LaTeX code for the table in string format.
@@ -226,24 +559,8 @@ class Table(ABC):
 
         self.compute_table()
 
-        self.latex_doc = """
-        \\documentclass{article}
-        \\title{Algorithms Comparison}
-        \\usepackage{colortbl}
-        \\usepackage{float}
-        \\usepackage{rotating}
-        \\usepackage[table*]{xcolor}
-        \\usepackage{tabularx}
-        \\usepackage{siunitx}
-        \\sisetup{output-exponent-marker=\\text{e}}
-        \\xdefinecolor{gray95}{gray}{0.65}
-        \\xdefinecolor{gray25}{gray}{0.8}
-        \\author{YourName}
-        \\begin{document}
-        \\maketitle
-        \\section{Tables}"""
-        
-        self.latex_doc += "\\begin{sidewaystable}" if sideways else "\\begin{table}[H]"
+        # Step 1: Start the LaTeX document, its parts are only joined when `latex_doc` is read
+        self._parts = [_LATEX_PREAMBLE, _LATEX_TABLE_BEGIN[bool(sideways)]]
 
         # Step 2: Append the provided body content to the LaTeX document
         self._latex_header()
@@ -251,9 +568,7 @@ class Table(ABC):
         self._latex_footer(sideways)
 
         # Step 3: Close the LaTeX document structure
-        self.latex_doc += """
-        \\end{document}
-        """
+        self._parts.append(_LATEX_POSTAMBLE)
 
     @abstractmethod
     def show() -> None:
@@ -265,21 +580,27 @@ class Table(ABC):
         """Creates the LaTeX header for the table."""
         pass
 
+    def _latex_caption_header(self, caption: str, columns: str, names: str, lead: str = "") -> None:
+        """Appends the caption and the tabular opening with the given column layout and column names."""
+        self._parts.append(_LATEX_HEADER.format_map(
+            {"lead": lead, "metric": self.metric, "caption": caption, "columns": columns, "names": names}
+        ))
+
     def _latex_footer(self, sideways: bool) -> None:
         """Creates the LaTeX footer for the table."""
 
-        self.latex_doc += """
-        \\end{tabular}
-        \\end{scriptsize}
-        """ 
-        
-        self.latex_doc += "\\end{sidewaystable}" if sideways else "\\end{table}"
+        self._parts.append(_LATEX_TABULAR_END)
+        self._parts.append(_LATEX_TABLE_END[bool(sideways)])
 
     @abstractmethod
     def _create_latex_table(self) -> None:
         """Creates the LaTeX table content."""
         pass
 
+    def _latex_rows(self, rows: list) -> None:
+        """Appends the given rows (lists of already formatted cells) to the LaTeX table."""
+        self._parts.append(_LATEX_ROWS.render(rows=rows))
+
     @abstractmethod
     def compute_table(self) -> None:
         """
@@ -313,26 +634,57 @@ class Table(ABC):
         # Retrieve mean/median and std/iqr values for the given instance
         mean_median  = self.mean_median.loc[instance]
         std_iqr = self.std_iqr.loc[instance]
-        
-        # Default to mean/median for ranking
-        df_global = mean_median.copy()
-        if self.maximize:
-            # Find the best and second-best algorithms based on highest values
-            max_idx = df_global.idxmax()
-            second_idx = df_global.drop(max_idx).idxmax()
-        else:
-            # Find the best and second-best algorithms based on lowest values
-            max_idx = df_global.idxmin()
-            second_idx = df_global.drop(max_idx).idxmin()
 
-        if df_global[max_idx] == df_global[second_idx]:
-            # If there's a tie, use std/iqr to decide
-            df_global = std_iqr.copy()
-            max_idx = df_global.idxmin()
-            second_idx = df_global.drop(max_idx).idxmin()
+        # The ranking of all the instances is computed once and shared by every table built on the same data
+        max_idx, second_idx = self.algorithms[self._top_two_positions()[self.mean_median.index.get_loc(instance)]]
 
         return mean_median, std_iqr, max_idx, second_idx
 
+    def _top_two_positions(self) -> np.ndarray:
+        """Returns the positions of the best and second best algorithms of every instance."""
+        return _top_two(
+            self._context, self.normal, bool(self.maximize), tuple(self.algorithms), tuple(self.instances)
+        )
+
+    def _latex_score_rows(self, wrap_si: bool = True, suffixes: np.ndarray = None, extra_column: np.ndarray = None) -> None:
+        """
+        Appends one row per instance with the mean/median and std/iqr of every algorithm, highlighting the best two.
+
+        Args:
+            wrap_si (bool):
+                Whether the values are wrapped in siunitx `\\SI` commands. Default is True.
+
+            suffixes (np.ndarray):
+                An optional (instances x algorithms) array of strings appended to every cell, such as test results.
+
+            extra_column (np.ndarray):
+                An optional array with one value per instance added as the last column, such as the Friedman result.
+        """
+
+        # Format the cells of every instance and algorithm at once
+        if wrap_si:
+            parts = ["$\\SI{", self._mean_median_strings, "}{}_{ \\SI{", self._std_iqr_strings, "}{} }"]
+        else:
+            parts = ["$", self._mean_median_strings, "_{ ", self._std_iqr_strings, " }"]
+        if suffixes is not None:
+            parts += [" ", np.asarray(suffixes, dtype=str)]
+        cells = reduce(np.char.add, parts + ["$"])
+
+        # Highlight the best and second best algorithms of every instance
+        top_two = self._top_two_positions()
+        colors = np.full(cells.shape, "", dtype=f"U{max(len(_CELL_BEST), len(_CELL_SECOND))}")
+        colors[np.arange(len(self.instances)), top_two[:, 0]] = _CELL_BEST
+        colors[np.arange(len(self.instances)), top_two[:, 1]] = _CELL_SECOND
+        cells = np.char.add(colors, cells)
+
+        # Add the instance name and, if given, the result of the instance to the last column
+        rows = [[instance] + row for instance, row in zip(self.instances, cells.tolist())]
+        if extra_column is not None:
+            for row, result in zip(rows, extra_column):
+                row.append(result)
+
+        self._latex_rows(rows)
+
 class MeanMedian(Table):
     """Class for generating the Mean and Standard Deviation or Median and Interquartile Range table."""
 
@@ -351,9 +703,9 @@ class MeanMedian(Table):
     
         self.compute_table()
         if self.maximize:
-            styled_df = self.table.style.apply(_highlight_max, axis=1)
+            styled_df = self.table.style.apply(_highlight_max, axis=None)
         else:
-            styled_df = self.table.style.apply(_highlight_min, axis=1)
+            styled_df = self.table.style.apply(_highlight_min, axis=None)
 
         styled_df.format({col: "{:.4e}" for col in self.table.select_dtypes(include=["number"]).columns})
 
@@ -362,38 +714,12 @@ class MeanMedian(Table):
     def _create_latex_table(self) -> None:
         """Creates the LaTeX table content."""
 
-        # Loop over instances and format the row data
-        for instance in self.instances:
-            row_data = f"{instance} & "
-            mean_median, std_iqr, max_idx, second_idx = self.rank_top_two(instance)
-
-            # Loop over algorithms and format the row data
-            for algorithm in self.algorithms:
-                score1 = mean_median[algorithm]
-                score2 = std_iqr[algorithm]
-
-                # Create the formatted string based on conditions
-                if algorithm == max_idx:
-                    row_data += f"\\cellcolor{{gray95}}${score1:.2e}_{{ {score2:.2e} }}$ & "
-                elif algorithm == second_idx:
-                    row_data += f"\\cellcolor{{gray25}}${score1:.2e}_{{ {score2:.2e} }}$ & "
-                else:
-                    row_data += f"${score1:.2e}_{{ {score2:.2e} }}$ & "
-
-            self.latex_doc += row_data.rstrip(" & ") + " \\\\ \n"
+        self._latex_score_rows(wrap_si=False)
 
     def _latex_header(self) -> None:
         """Creates the LaTeX header for the table."""
 
-        self.latex_doc += """
-        \\
-        \\caption{""" + self.metric + """.  """ + str(self.__repr__()) + """}
-        \\vspace{1mm}
-        \\centering
-        \\begin{scriptsize}
-        \\begin{tabular}{l|""" + """c|""" * (len(self.algorithms) - 1) + """c}
-        \\hline
-        & """ + " & ".join(self.algorithms) + " \\\\ \\hline\n"
+        self._latex_caption_header(str(self.__repr__()), self._column_spec, self._algorithm_header, lead="\n        \\")
 
     def __str__(self) -> str:
         """Returns the name of the table."""
@@ -434,27 +760,16 @@ class Friedman(Table):
         self.compute_base_table()
 
         self.table = self.mean_median.copy()
-        for instance in self.instances:
-            data = self.data[self.data['Instance'] == instance]
-            friedman_table = data.pivot(index='ExecutionId', 
-                                        columns='Algorithm', 
-                                        values='MetricValue').reset_index().drop(columns='ExecutionId')
-
-            friedman_results = friedman_tests[self.friedman_test](friedman_table, self.maximize)
-            
-            if friedman_results["Results"]["p-value"] < 0.05:
-                self.table.loc[instance, 'Friedman'] = "+"
-            else:
-                self.table.loc[instance, 'Friedman'] = "="
+        self.table['Friedman'] = np.where(self._friedman_p_values(self.friedman_test) < 0.05, "+", "=")
 
     def show(self)  -> None:
         """Displays the table in a Jupyter notebook."""
 
         self.compute_table()
         if self.maximize:
-            styled_df = self.table.style.apply(_highlight_max, axis=1)
+            styled_df = self.table.style.apply(_highlight_max, axis=None)
         else:
-            styled_df = self.table.style.apply(_highlight_min, axis=1)
+            styled_df = self.table.style.apply(_highlight_min, axis=None)
 
         styled_df.format({col: "{:.4e}" for col in self.table.select_dtypes(include=["number"]).columns})
 
@@ -463,41 +778,14 @@ class Friedman(Table):
     def _create_latex_table(self) -> None:
         """Creates the LaTeX table content."""
 
-        # Loop over instances and format the row data
-        for instance in self.instances:
-            row_data = f"{instance} & "
-            mean_median, std_iqr, max_idx, second_idx = self.rank_top_two(instance)
-
-            # Loop over algorithms and format the row data
-            for algorithm in self.algorithms:
-                score1 = mean_median[algorithm]
-                score2 = std_iqr[algorithm]
-
-                # Create the formatted string based on conditions
-                if algorithm == max_idx:
-                    row_data += f"\\cellcolor{{gray95}}$\\SI{{{score1:.2e}}}{{}}_{{ \\SI{{{score2:.2e}}}{{}} }}$ & "
-                elif algorithm == second_idx:
-                    row_data += f"\\cellcolor{{gray25}}$\\SI{{{score1:.2e}}}{{}}_{{ \\SI{{{score2:.2e}}}{{}} }}$ & "
-                else:
-                    row_data += f"$\\SI{{{score1:.2e}}}{{}}_{{ \\SI{{{score2:.2e}}}{{}} }}$ & "
-
-                # Add the Friedman result to the last column
-                if algorithm == self.algorithms[-1]:
-                    row_data += f"{self.table.loc[instance, 'Friedman']} & "
-
-            self.latex_doc += row_data.rstrip(" & ") + " \\\\ \n"
+        self._latex_score_rows(extra_column=self.table['Friedman'].to_numpy())
 
     def _latex_header(self) -> None:
         """Creates the LaTeX header for the table."""
 
-        self.latex_doc += """
-        \\caption{""" + self.metric + """.  """ + str(self.__repr__()) + f" (+ implies that the difference between the algorithms for the instance in the select row is significant)\n" + """}
-        \\vspace{1mm}
-        \\centering
-        \\begin{scriptsize}
-        \\begin{tabular}{l|""" + """c|""" * (len(self.algorithms)) + """c}
-        \\hline
-        & """ + " & ".join(self.algorithms) + " & FT \\\\ \\hline\n"
+        self._latex_caption_header(
+            str(self.__repr__()) + _SIGNIFICANCE_NOTE, self._column_spec + "|c", self._algorithm_header + " & FT"
+        )
 
     def __str__(self) -> str:
         """Returns the name of the table."""
@@ -510,10 +798,10 @@ class Friedman(Table):
         else:
             return f"Median and Interquartile Range Friedman {self.friedman_test} Table"
 
-class WilcoxonPivot(Table):
-    """Class for generating the Wilcoxon Pivot table."""
+class PivotTable(Table):
+    """Abstract class for generating the tables that compare every algorithm against a pivot algorithm."""
     def __init__(self, data: str | pd.DataFrame, metrics: str | pd.DataFrame, metric: str, normal: bool = False, pivot: str = None) -> None:
-        """Initializes the WilcoxonPivot object with the given data, metrics, metric, and normality."""
+        """Initializes the PivotTable object with the given data, metrics, metric, normality and pivot algorithm."""
         super().__init__(data, metrics, metric, normal=normal)
 
         # Move the pivot algorithm to the last position
@@ -524,30 +812,34 @@ class WilcoxonPivot(Table):
             self.algorithms = self.algorithms[self.algorithms != pivot]
             self.algorithms = np.append(self.algorithms, pivot)
 
-    def compute_table(self) -> None:
-        """Computes the Wilcoxon Pivot table."""
+        # Scores and test results of the table, as (instances x algorithms) arrays
+        self.scores = None
+        self.test_results = None
+
+    @property
+    def table(self) -> pd.DataFrame:
+        """The (score, test result) pair of every instance and algorithm, built from `scores` and `test_results` on first access."""
+
+        if self._table is None and self.test_results is not None:
+            cells = [list(zip(scores, results)) for scores, results in zip(self.scores, self.test_results)]
+            self._table = pd.DataFrame(cells, index=self.mean_median.index, columns=self.mean_median.columns)
+        return self._table
+
+    @table.setter
+    def table(self, table: pd.DataFrame) -> None:
+        self._table = table
+
+    def _compute_pivot_table(self, test) -> None:
+        """Computes the pivot table using the given pairwise statistical test."""
 
-        if self.normal:
-            self.logger.warning('Wilcoxon test is only applicable for non normal data. The test will be skipped.')
-            return
-        
         self.compute_base_table()
 
-        self.table = self.mean_median.copy().map(lambda x: (x, ''))
-        pivot_algorithm = self.algorithms[-1]
-        for instance in self.instances:
-            data = self.data[self.data['Instance'] == instance]
-            data = data.pivot(index='ExecutionId', columns='Algorithm', values='MetricValue').reset_index().drop(columns='ExecutionId')
-
-            for algorithm in self.algorithms:
-                if algorithm == pivot_algorithm:
-                    continue
-                
-                wilconxon_table = data[[pivot_algorithm, algorithm]]
-                wilconxon_table.index.name, wilconxon_table.columns.name = None, None
-                wilconxon_table.columns = ["Algorithm A", "Algorithm B"]
-                wilcoxon_result = wilcoxon(wilconxon_table, self.maximize)
-                self.table.loc[instance, algorithm] = (self.table.loc[instance, algorithm][0], wilcoxon_result)
+        # The test results are shared by every table built on the same data, so they are read-only
+        test_results = _pivot_results(
+            self._context, tuple(self.algorithms), tuple(self.instances), test, self.maximize
+        )
+
+        self.scores, self.test_results, self.table = self.mean_median.to_numpy(), test_results, None
     
     def show(self) -> None:
         """Displays the table in a Jupyter notebook."""
@@ -556,56 +848,76 @@ class WilcoxonPivot(Table):
     def _create_latex_table(self) -> None:
         """Creates the LaTeX table content."""
 
-        ranks = {algorithm: [0, 0, 0] for algorithm in self.algorithms[:-1]}
-        # Loop over instances and format the row data
-        for instance in self.instances:
-            row_data = f"{instance} & "
-            mean_median, std_iqr, max_idx, second_idx = self.rank_top_two(instance)
-
-            # Loop over algorithms and format the row data
-            for algorithm in self.algorithms:
-                wilcoxon_result = self.table.loc[instance, algorithm][1]
-
-                # Update the ranks for the Wilcoxon test results
-                if algorithm != self.algorithms[-1]:
-                    if wilcoxon_result == "+":
-                        ranks[algorithm][0] += 1
-                    elif wilcoxon_result == "-":
-                        ranks[algorithm][1] += 1
-                    else:
-                        ranks[algorithm][2] += 1
-
-                score1 = mean_median[algorithm]
-                score2 = std_iqr[algorithm]
-
-                # Create the formatted string based on conditions
-                if algorithm == max_idx:
-                    row_data += f"\\cellcolor{{gray95}}$\\SI{{{score1:.2e}}}{{}}_{{ \\SI{{{score2:.2e}}}{{}} }} {wilcoxon_result}$ & "
-                elif algorithm == second_idx:
-                    row_data += f"\\cellcolor{{gray25}}$\\SI{{{score1:.2e}}}{{}}_{{ \\SI{{{score2:.2e}}}{{}} }} {wilcoxon_result}$ & "
-                else:
-                    row_data += f"$\\SI{{{score1:.2e}}}{{}}_{{ \\SI{{{score2:.2e}}}{{}} }} {wilcoxon_result}$ & "
-
-            self.latex_doc += row_data.rstrip(" & ") + " \\\\ \n"
-
-        # Add the last row with the ranks
-        self.latex_doc += """\\hline + / - / ="""
-        for _, rank in ranks.items():
-            self.latex_doc += f" & \\textbf{rank[0]} / \\textbf{rank[1]} / \\textbf{rank[2]}"
+        self._latex_score_rows(suffixes=self.test_results)
+
+        # Add the last row with the ranks, counting the test results of every algorithm against the pivot at once
+        wins = (self.test_results[:, :-1] == "+").sum(axis=0)
+        losses = (self.test_results[:, :-1] == "-").sum(axis=0)
+        ties = len(self.instances) - wins - losses
+        ranks = [f"\\textbf{win} / \\textbf{loss} / \\textbf{tie}" for win, loss, tie in zip(wins, losses, ties)]
+        self._parts.append(" & ".join(["\\hline + / - / ="] + ranks))
 
     def _latex_header(self) -> None:
         """Creates the LaTeX header for the table."""
 
-        self.latex_doc += """
-        \\caption{""" + self.metric + """.  """ + str(self.__repr__()) + (
-            f" (- implies that the pivot algorithm (last column) is statistically "
-            f"worse, = indicates that the differences are not significant.)\n") + """}
-        \\vspace{1mm}
-        \\centering
-        \\begin{scriptsize}
-        \\begin{tabular}{l|""" + """c|""" * (len(self.algorithms) - 1) + """c}
-        \\hline
-        & """ + " & ".join(self.algorithms) + " \\\\ \\hline\n"
+        self._latex_caption_header(str(self.__repr__()) + _PIVOT_NOTE, self._column_spec, self._algorithm_header)
+
+class PairwiseTable(Table):
+    """Abstract class for generating the tables that compare every pair of algorithms (1vs1)."""
+
+    def _compute_pairwise_table(self, test) -> None:
+        """Computes the 1vs1 table using the given pairwise statistical test."""
+
+        self.compute_base_table()
+
+        self.table = pd.DataFrame("", index=self.algorithms[:-1], columns=self.algorithms[1:])
+        results = _pairwise_results(
+            self._context, tuple(self.algorithms), tuple(self.instances), test, self.maximize
+        )
+
+        # The columns start at the second algorithm, so the pair (i, j) is at column j - 1
+        for (i, j), test_result in results.items():
+            self.table.iat[i, j - 1] = test_result
+    
+    def show(self) -> None:
+        """Displays the table in a Jupyter notebook."""
+        self.compute_table()
+        return self.table.style.set_properties(**{'font-size': '12px', 'font-family': 'monospace'})
+
+    def _create_latex_table(self) -> None:
+        """Creates the LaTeX table content."""
+
+        # Every pair is only shown once, above the diagonal, and the cell of an algorithm against itself is empty
+        results = self.table.to_numpy(dtype=str)
+        cells = np.char.add(np.char.add("\\texttt{", np.where(np.triu(np.ones(results.shape, dtype=bool)), results, "")), "}")
+        cells[np.eye(*cells.shape, k=-1, dtype=bool)] = ""
+
+        for algorithm, row in zip(self.algorithms[:-1], cells.tolist()):
+            self._parts.append(" & ".join([algorithm] + row) + " \\\\\n")
+
+    def _latex_header(self) -> None:
+        """Creates the LaTeX header for the table."""
+
+        self._latex_caption_header(
+            str(self.__repr__()) + _PAIRWISE_NOTE + f" Instances (in order) : {self.instances}\n",
+            "c|" * (len(self.algorithms) - 2) + "c",
+            " & ".join(self.algorithms[1:])
+        )
+
+class WilcoxonPivot(PivotTable):
+    """Class for generating the Wilcoxon Pivot table."""
+    def __init__(self, data: str | pd.DataFrame, metrics: str | pd.DataFrame, metric: str, normal: bool = False, pivot: str = None) -> None:
+        """Initializes the WilcoxonPivot object with the given data, metrics, metric, and normality."""
+        super().__init__(data, metrics, metric, normal=normal, pivot=pivot)
+
+    def compute_table(self) -> None:
+        """Computes the Wilcoxon Pivot table."""
+
+        if self.normal:
+            self.logger.warning('Wilcoxon test is only applicable for non normal data. The test will be skipped.')
+            return
+        
+        self._compute_pivot_table(wilcoxon)
 
     def __str__(self) -> str:
         """Returns the name of the table."""
@@ -618,7 +930,7 @@ class WilcoxonPivot(Table):
         else:
             return "Median and Interquartile Range Wilcoxon Pivot Table"
 
-class Wilcoxon(Table):
+class Wilcoxon(PairwiseTable):
     """Class for generating the Wilcoxon table."""
     def __init__(self, data: str | pd.DataFrame, metrics: str | pd.DataFrame, metric: str, normal: bool = False) -> None:
         """Initializes the Wilcoxon object with the given data, metrics, metric, and normality."""
@@ -631,78 +943,7 @@ class Wilcoxon(Table):
             self.logger.warning('Wilcoxon test is only applicable for non normal data. The test will be skipped.')
             return
 
-        self.compute_base_table()
-
-        self.table = pd.DataFrame("", index=self.algorithms[:-1], columns=self.algorithms[1:])
-
-        for i, fila in enumerate(self.algorithms[:-1]):
-            for _, columna in enumerate(self.algorithms[i+1:]):
-                wilcoxon_result = ""
-                for instance in self.instances:
-                    data = self.data[self.data['Instance'] == instance]
-                    data = data.pivot(index='ExecutionId', columns='Algorithm', values='MetricValue').reset_index().drop(columns='ExecutionId')
-                    wilcoxon_table = data[[fila, columna]]
-                    wilcoxon_table.index.name, wilcoxon_table.columns.name = None, None
-                    wilcoxon_table.columns = ["Algorithm A", "Algorithm B"]
-                    wilcoxon_result += wilcoxon(wilcoxon_table, self.maximize)
-                
-                self.table.at[fila, columna] = wilcoxon_result
-    
-    def show(self) -> None:
-        """Displays the table in a Jupyter notebook."""
-        self.compute_table()
-        return self.table.style.set_properties(**{'font-size': '12px', 'font-family': 'monospace'})
-
-    def _create_latex_table(self) -> None:
-        """Creates the LaTeX table content."""
-
-        # Generate comparisons and populate table
-        compared_pairs = set()
-
-        # Loop over algorithms and format the row data
-        for algorithm1 in self.algorithms:
-            if algorithm1 == self.algorithms[-1]:
-                continue
-            self.latex_doc += algorithm1 + " & "
-
-            # Loop over algorithms and format the row data
-            for algorithm2 in self.algorithms:
-                if algorithm2 == self.algorithms[0]:
-                    continue
-                if algorithm1 == algorithm2:
-                    self.latex_doc += " & "
-                    continue
-
-                # Create a pair of algorithms
-                pair = tuple(sorted([algorithm1, algorithm2]))
-                self.latex_doc += "\\texttt{"
-                
-                # Check if the pair has already been processed
-                if pair not in compared_pairs:
-                    # Mark the pair as processed
-                    compared_pairs.add(pair)
-                    for index, _ in enumerate(self.instances):
-                        wilcoxon_results = self.table.loc[algorithm1, algorithm2][index]
-                        self.latex_doc += wilcoxon_results
-                        
-                self.latex_doc += "} & "
-            self.latex_doc = self.latex_doc.rstrip(" & ") + " \\\\\n"
-
-    def _latex_header(self) -> None:
-        """Creates the LaTeX header for the table."""
-
-        header_explanation = (". Each symbol in the cells represents a problem. Symbol - indicates that the row "
-                          "algorithm performs worse with statistical confidence;  symbol = implies that "
-                          "the differences are not significant.")
-        
-        self.latex_doc += """
-        \\caption{""" + self.metric + """.  """ + str(self.__repr__()) + header_explanation + f" Instances (in order) : {self.instances}\n" + """}
-        \\vspace{1mm}
-        \\centering
-        \\begin{scriptsize}
-        \\begin{tabular}{l|""" + """c|""" * (len(self.algorithms) - 2) + """c}
-        \\hline
-        & """ + " & ".join(self.algorithms[1:]) + " \\\\ \\hline\n"
+        self._compute_pairwise_table(wilcoxon)
 
     def __str__(self) -> str:
         """Returns the name of the table."""
@@ -726,33 +967,17 @@ class FriedmanPValues(Table):
             return
 
         self.compute_base_table()
-        self.table = pd.DataFrame(0.0, 
-                                  index=self.instances, 
-                                  columns=["Friedman p-value", "Friedman Aligned p-value", "Quade p-value", "Friedman"])
-        
-        self.table["Friedman"] = "="
 
-        # Loop over instances and format the row data
-        for instance in self.instances:
-            # Get the data for the instance
-            data = self.data[self.data['Instance'] == instance]
-            friedman_table = data.pivot(index='ExecutionId', 
-                                        columns='Algorithm', 
-                                        values='MetricValue').reset_index().drop(columns='ExecutionId')
-            
-            # Compute the Friedman test results
-            friedman_results = friedman(friedman_table, self.maximize)
-            friedman_aligned_results = friedman_aligned_rank(friedman_table, self.maximize)
-            quade_results = quade(friedman_table, self.maximize)
+        # Collect the p-values of each test on all the instances
+        p_values = np.column_stack([self._friedman_p_values(name) for name in ("base", "aligned", "quade")])
 
-            # Update the table with the p-values
-            self.table.loc[instance, 'Friedman p-value'] = friedman_results["Results"]["p-value"]
-            self.table.loc[instance, 'Friedman Aligned p-value'] = friedman_aligned_results["Results"]["p-value"]
-            self.table.loc[instance, 'Quade p-value'] = quade_results["Results"]["p-value"]
+        self.table = pd.DataFrame(p_values, 
+                                  index=self.instances, 
+                                  columns=["Friedman p-value", "Friedman Aligned p-value", "Quade p-value"], 
+                                  dtype=float)
 
-            # Update the table with the Friedman result
-            if friedman_results["Results"]["p-value"] < 0.05 and friedman_aligned_results["Results"]["p-value"] < 0.05 and quade_results["Results"]["p-value"] < 0.05:
-                self.table.loc[instance, 'Friedman'] = "+"
+        # The Friedman result is + only if the three tests are significant
+        self.table["Friedman"] = np.where((self.table < 0.05).all(axis=1), "+", "=")
 
     def show(self)  -> None:
         """Displays the table in a Jupyter notebook."""
@@ -766,34 +991,21 @@ class FriedmanPValues(Table):
     def _create_latex_table(self) -> None:
         """Creates the LaTeX table content."""
 
-        # Loop over instances and format the row data
-        for instance in self.instances:
-            row_data = f"{instance} & "
-            # Loop over algorithms and format the row data
-            for name in self.table.columns:
-                # Get the value for the instance and name
-                value = self.table.loc[instance, name]
-
-                # Create the formatted string based on conditions
-                if type(value) == str:
-                    row_data += f"$\\text{{{value}}}$ & "
-                else:
-                    row_data += f"$\\SI{{{value:.2e}}}{{}}$ & "
+        # Format the p-values of all the instances at once, followed by the Friedman result
+        p_values = np.char.mod("%.2e", self.table.iloc[:, :-1].to_numpy(dtype=float))
+        p_values = np.char.add(np.char.add("$\\SI{", p_values), "}{}$")
+        results = np.char.add(np.char.add("$\\text{", self.table.iloc[:, -1].to_numpy(dtype=str)), "}$")
 
-            # Add the row data to the LaTeX document
-            self.latex_doc += row_data.rstrip(" & ") + " \\\\ \n"
+        self._latex_rows([[instance] + row + [result] for instance, row, result in zip(self.instances, p_values.tolist(), results)])
 
     def _latex_header(self) -> None:
         """Creates the LaTeX header for the table."""
 
-        self.latex_doc += """
-        \\caption{""" + self.metric + """.  """ + str(self.__repr__()) + f" (+ implies that the difference between the algorithms for the instance in the select row is significant)\n" + """}
-        \\vspace{1mm}
-        \\centering
-        \\begin{scriptsize}
-        \\begin{tabular}{l|""" + """c|""" * (len(friedman_tests)) + """c}
-        \\hline
-        & """ + " & ".join([f"friedman {name} test" for name in friedman_tests.keys()]) + " & FT \\\\ \\hline\n"
+        self._latex_caption_header(
+            str(self.__repr__()) + _SIGNIFICANCE_NOTE,
+            "c|" * len(friedman_tests) + "c",
+            " & ".join([f"friedman {name} test" for name in friedman_tests.keys()]) + " & FT"
+        )
 
     def __str__(self) -> str:
         """Returns the name of the table."""
@@ -832,27 +1044,23 @@ class Anova(Table):
         self.compute_base_table()
 
         self.table = self.mean_median.copy()
+        instance_tables = self._instance_tables()
+        anova_marks = []
         for instance in self.instances:
-            data = self.data[self.data['Instance'] == instance]
-            anova_table = data.pivot(index='ExecutionId', 
-                                        columns='Algorithm', 
-                                        values='MetricValue').reset_index().drop(columns='ExecutionId')
-
+            anova_table = instance_tables[instance]
             anova_results = anova(anova_table)
-            
-            if anova_results["Results"]["p-value"] < 0.05:
-                self.table.loc[instance, 'Anova'] = "+"
-            else:
-                self.table.loc[instance, 'Anova'] = "="
+            anova_marks.append("+" if anova_results["Results"]["p-value"] < 0.05 else "=")
+
+        self.table['Anova'] = anova_marks
 
     def show(self)  -> None:
         """Displays the table in a Jupyter notebook."""
 
         self.compute_table()
         if self.maximize:
-            styled_df = self.table.style.apply(_highlight_max, axis=1)
+            styled_df = self.table.style.apply(_highlight_max, axis=None)
         else:
-            styled_df = self.table.style.apply(_highlight_min, axis=1)
+            styled_df = self.table.style.apply(_highlight_min, axis=None)
 
         styled_df.format({col: "{:.4e}" for col in self.table.select_dtypes(include=["number"]).columns})
 
@@ -861,41 +1069,14 @@ class Anova(Table):
     def _create_latex_table(self) -> None:
         """Creates the LaTeX table content."""
 
-        # Loop over instances and format the row data
-        for instance in self.instances:
-            row_data = f"{instance} & "
-            mean_median, std_iqr, max_idx, second_idx = self.rank_top_two(instance)
-
-            # Loop over algorithms and format the row data
-            for algorithm in self.algorithms:
-                score1 = mean_median[algorithm]
-                score2 = std_iqr[algorithm]
-
-                # Create the formatted string based on conditions
-                if algorithm == max_idx:
-                    row_data += f"\\cellcolor{{gray95}}$\\SI{{{score1:.2e}}}{{}}_{{ \\SI{{{score2:.2e}}}{{}} }}$ & "
-                elif algorithm == second_idx:
-                    row_data += f"\\cellcolor{{gray25}}$\\SI{{{score1:.2e}}}{{}}_{{ \\SI{{{score2:.2e}}}{{}} }}$ & "
-                else:
-                    row_data += f"$\\SI{{{score1:.2e}}}{{}}_{{ \\SI{{{score2:.2e}}}{{}} }}$ & "
-
-                # Add the Anova result to the last column
-                if algorithm == self.algorithms[-1]:
-                    row_data += f"{self.table.loc[instance, 'Anova']} & "
-
-            self.latex_doc += row_data.rstrip(" & ") + " \\\\ \n"
+        self._latex_score_rows(extra_column=self.table['Anova'].to_numpy())
 
     def _latex_header(self) -> None:
         """Creates the LaTeX header for the table."""
 
-        self.latex_doc += """
-        \\caption{""" + self.metric + """.  """ + str(self.__repr__()) + f" (+ implies that the difference between the algorithms for the instance in the select row is significant)\n" + """}
-        \\vspace{1mm}
-        \\centering
-        \\begin{scriptsize}
-        \\begin{tabular}{l|""" + """c|""" * (len(self.algorithms)) + """c}
-        \\hline
-        & """ + " & ".join(self.algorithms) + " & FT \\\\ \\hline\n"
+        self._latex_caption_header(
+            str(self.__repr__()) + _SIGNIFICANCE_NOTE, self._column_spec + "|c", self._algorithm_header + " & FT"
+        )
 
     def __str__(self) -> str:
         """Returns the name of the table."""
@@ -908,19 +1089,11 @@ class Anova(Table):
         else:
             return "Median and Interquartile Range Anova Table"
 
-class TTestPivot(Table):
+class TTestPivot(PivotTable):
     """Class for generating the T-Test Pivot table."""
     def __init__(self, data: str | pd.DataFrame, metrics: str | pd.DataFrame, metric: str, normal: bool = True, pivot: str = None) -> None:
         """Initializes the T-Test Pivot object with the given data, metrics, metric, and normality."""
-        super().__init__(data, metrics, metric, normal=normal)
-
-        # Move the pivot algorithm to the last position
-        if pivot is not None:
-            if pivot not in self.algorithms:
-                raise ValueError(f"Algorithm {pivot} not found in the data.")
-            
-            self.algorithms = self.algorithms[self.algorithms != pivot]
-            self.algorithms = np.append(self.algorithms, pivot)
+        super().__init__(data, metrics, metric, normal=normal, pivot=pivot)
 
     def compute_table(self) -> None:
         """Computes the T-Test Pivot table."""
@@ -932,81 +1105,7 @@ class TTestPivot(Table):
         if not self.normality:
             self.logger.warning('T-Test Pivot test is only applicable for normal data. The test will not be skipped.')
         
-        self.compute_base_table()
-
-        self.table = self.mean_median.copy().map(lambda x: (x, ''))
-        pivot_algorithm = self.algorithms[-1]
-        for instance in self.instances:
-            data = self.data[self.data['Instance'] == instance]
-            data = data.pivot(index='ExecutionId', columns='Algorithm', values='MetricValue').reset_index().drop(columns='ExecutionId')
-            
-            for algorithm in self.algorithms:
-                if algorithm == pivot_algorithm:
-                    continue
-                
-                ttest_table = data[[pivot_algorithm, algorithm]]
-                ttest_table.index.name, ttest_table.columns.name = None, None
-                ttest_table.columns = ["Algorithm A", "Algorithm B"]
-                wilcoxon_result = t_test(ttest_table, self.maximize)
-                self.table.loc[instance, algorithm] = (self.table.loc[instance, algorithm][0], wilcoxon_result)
-    
-    def show(self) -> None:
-        """Displays the table in a Jupyter notebook."""
-        pass
-
-    def _create_latex_table(self) -> None:
-        """Creates the LaTeX table content."""
-
-        ranks = {algorithm: [0, 0, 0] for algorithm in self.algorithms[:-1]}
-        # Loop over instances and format the row data
-        for instance in self.instances:
-            row_data = f"{instance} & "
-            mean_median, std_iqr, max_idx, second_idx = self.rank_top_two(instance)
-
-            # Loop over algorithms and format the row data
-            for algorithm in self.algorithms:
-                ttest_result = self.table.loc[instance, algorithm][1]
-
-                # Update the ranks for the T-Test test results
-                if algorithm != self.algorithms[-1]:
-                    if ttest_result == "+":
-                        ranks[algorithm][0] += 1
-                    elif ttest_result == "-":
-                        ranks[algorithm][1] += 1
-                    else:
-                        ranks[algorithm][2] += 1
-
-                score1 = mean_median[algorithm]
-                score2 = std_iqr[algorithm]
-
-                # Create the formatted string based on conditions
-                if algorithm == max_idx:
-                    row_data += f"\\cellcolor{{gray95}}$\\SI{{{score1:.2e}}}{{}}_{{ \\SI{{{score2:.2e}}}{{}} }} {ttest_result}$ & "
-                elif algorithm == second_idx:
-                    row_data += f"\\cellcolor{{gray25}}$\\SI{{{score1:.2e}}}{{}}_{{ \\SI{{{score2:.2e}}}{{}} }} {ttest_result}$ & "
-                else:
-                    row_data += f"$\\SI{{{score1:.2e}}}{{}}_{{ \\SI{{{score2:.2e}}}{{}} }} {ttest_result}$ & "
-
-            self.latex_doc += row_data.rstrip(" & ") + " \\\\ \n"
-
-        # Add the last row with the ranks
-        self.latex_doc += """\\hline + / - / ="""
-        for _, rank in ranks.items():
-            self.latex_doc += f" & \\textbf{rank[0]} / \\textbf{rank[1]} / \\textbf{rank[2]}"
-
-    def _latex_header(self) -> None:
-        """Creates the LaTeX header for the table."""
-
-        self.latex_doc += """
-        \\caption{""" + self.metric + """.  """ + str(self.__repr__()) + (
-            f" (- implies that the pivot algorithm (last column) is statistically "
-            f"worse, = indicates that the differences are not significant.)\n") + """}
-        \\vspace{1mm}
-        \\centering
-        \\begin{scriptsize}
-        \\begin{tabular}{l|""" + """c|""" * (len(self.algorithms) - 1) + """c}
-        \\hline
-        & """ + " & ".join(self.algorithms) + " \\\\ \\hline\n"
+        self._compute_pivot_table(t_test)
 
     def __str__(self) -> str:
         """Returns the name of the table."""
@@ -1019,7 +1118,7 @@ class TTestPivot(Table):
         else:
             return "Median and Interquartile Range T-Test Pivot Table"
 
-class TTest(Table):
+class TTest(PairwiseTable):
     """Class for generating the T-Test table."""
     def __init__(self, data: str | pd.DataFrame, metrics: str | pd.DataFrame, metric: str, normal: bool = True) -> None:
         """Initializes the T-Test object with the given data, metrics, metric, and normality."""
@@ -1035,78 +1134,7 @@ class TTest(Table):
         if not self.normality:
             self.logger.warning('T-Test test is only applicable for normal data. The test will not be skipped.')
 
-        self.compute_base_table()
-
-        self.table = pd.DataFrame("", index=self.algorithms[:-1], columns=self.algorithms[1:])
-
-        for i, fila in enumerate(self.algorithms[:-1]):
-            for _, columna in enumerate(self.algorithms[i+1:]):
-                ttest_result = ""
-                for instance in self.instances:
-                    data = self.data[self.data['Instance'] == instance]
-                    data = data.pivot(index='ExecutionId', columns='Algorithm', values='MetricValue').reset_index().drop(columns='ExecutionId')
-                    ttest_table = data[[fila, columna]]
-                    ttest_table.index.name, ttest_table.columns.name = None, None
-                    ttest_table.columns = ["Algorithm A", "Algorithm B"]
-                    ttest_result += t_test(ttest_table, self.maximize)
-                
-                self.table.at[fila, columna] = ttest_result
-    
-    def show(self) -> None:
-        """Displays the table in a Jupyter notebook."""
-        self.compute_table()
-        return self.table.style.set_properties(**{'font-size': '12px', 'font-family': 'monospace'})
-
-    def _create_latex_table(self) -> None:
-        """Creates the LaTeX table content."""
-
-        # Generate comparisons and populate table
-        compared_pairs = set()
-
-        # Loop over algorithms and format the row data
-        for algorithm1 in self.algorithms:
-            if algorithm1 == self.algorithms[-1]:
-                continue
-            self.latex_doc += algorithm1 + " & "
-
-            # Loop over algorithms and format the row data
-            for algorithm2 in self.algorithms:
-                if algorithm2 == self.algorithms[0]:
-                    continue
-                if algorithm1 == algorithm2:
-                    self.latex_doc += " & "
-                    continue
-
-                # Create a pair of algorithms
-                pair = tuple(sorted([algorithm1, algorithm2]))
-                self.latex_doc += "\\texttt{"
-                
-                # Check if the pair has already been processed
-                if pair not in compared_pairs:
-                    # Mark the pair as processed
-                    compared_pairs.add(pair)
-                    for index, _ in enumerate(self.instances):
-                        ttest_results = self.table.loc[algorithm1, algorithm2][index]
-                        self.latex_doc += ttest_results
-                        
-                self.latex_doc += "} & "
-            self.latex_doc = self.latex_doc.rstrip(" & ") + " \\\\\n"
-
-    def _latex_header(self) -> None:
-        """Creates the LaTeX header for the table."""
-
-        header_explanation = (". Each symbol in the cells represents a problem. Symbol - indicates that the row "
-                          "algorithm performs worse with statistical confidence;  symbol = implies that "
-                          "the differences are not significant.")
-        
-        self.latex_doc += """
-        \\caption{""" + self.metric + """.  """ + str(self.__repr__()) + header_explanation + f" Instances (in order) : {self.instances}\n" + """}
-        \\vspace{1mm}
-        \\centering
-        \\begin{scriptsize}
-        \\begin{tabular}{l|""" + """c|""" * (len(self.algorithms) - 2) + """c}
-        \\hline
-        & """ + " & ".join(self.algorithms[1:]) + " \\\\ \\hline\n"
+        self._compute_pairwise_table(t_test)
 
     def __str__(self) -> str:
         """Returns the name of the table."""
@@ -1115,4 +1143,3 @@ class TTest(Table):
     def __repr__(self) -> str:
         """Returns the description of the table."""
         return "T-Test 1vs1 Table"
-    
\ No newline at end of file
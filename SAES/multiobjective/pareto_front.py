@@ -1,12 +1,69 @@
+from SAES.utils.file_cache import cache_path, save_cache
 from SAES.logger import get_logger
 
+from concurrent.futures import ThreadPoolExecutor
 from abc import ABC, abstractmethod
+from matplotlib.collections import LineCollection
+from functools import lru_cache
 import matplotlib.pyplot as plt
+import importlib.util
 import pandas as pd
+import numpy as np
 import os
 
 # Wikipedia reference: https://en.wikipedia.org/wiki/Parallel_coordinates
 
+def _read_front(front_path: str) -> np.ndarray:
+    """Reads the points of a front CSV file, reusing the last read while the file is unchanged."""
+
+    if not os.path.exists(front_path):
+        raise FileNotFoundError(f"Front {front_path} not found")
+    return _read_front_file(front_path, os.stat(front_path).st_mtime_ns)
+
+def _read_fronts(front_paths: list) -> list:
+    """Reads the fronts of every subplot of a figure at once, parsing the files in worker threads."""
+
+    with ThreadPoolExecutor(max_workers=min(len(front_paths), os.cpu_count() or 1)) as executor:
+        return list(executor.map(_read_front, front_paths))
+
+@lru_cache(maxsize=256)
+def _read_front_file(front_path: str, mtime: int) -> np.ndarray:
+    """
+    Parses a front CSV file into a read-only (objectives x points) array, cached by path and modification time.
+
+    If SAES_CACHE_DIR is set, the parsed front is also saved there as a .npy file, so later runs memory-map it instead 
+    of parsing the CSV file again until the file changes.
+    """
+
+    # Load the front saved by a previous run if the CSV file has not changed since then
+    npy_path = cache_path(front_path, "npy")
+    if npy_path is not None and os.path.exists(npy_path):
+        try:
+            return np.load(npy_path, mmap_mode="r")
+        except (OSError, ValueError):
+            pass
+
+    # Store the objectives as rows, so each one is handed to matplotlib as a contiguous float64 array without a copy
+    if importlib.util.find_spec("pyarrow") is None:
+        # Correctly rounded values, as pyarrow parses them, so the fronts do not depend on whether it is installed
+        front = pd.read_csv(front_path, header=None, float_precision="round_trip")
+        front = np.ascontiguousarray(front.to_numpy(dtype=np.float64).T)
+    else:
+        # pyarrow parses the columns straight into arrays, without building a DataFrame and its index
+        from pyarrow import csv
+        table = csv.read_csv(front_path, read_options=csv.ReadOptions(autogenerate_column_names=True))
+        front = np.vstack([column.to_numpy().astype(np.float64, copy=False) for column in table.columns])
+
+    # A cache that cannot be written is not an error, the CSV file is just parsed again next time
+    if npy_path is not None:
+        try:
+            save_cache(npy_path, lambda file: np.save(file, front))
+        except OSError:
+            pass
+
+    front.flags.writeable = False
+    return front
+
 class Front(ABC):
     """
     Abstract class to generate Pareto fronts for different algorithms and instances.
@@ -89,6 +146,9 @@ class Front(ABC):
             if os.path.isdir(f"{fronts_path}/{self.algorithms[0]}/{instance}")
         ])
 
+        # Paths of the median or best fronts of every algorithm, keyed by (instance, 'MEDIAN' or 'BEST')
+        self._front_paths = {}
+
         self.logger = get_logger(__name__)
 
     def save(self, instance: str, output_path: str, file_name: str = None, median: bool = True) -> None:
@@ -119,7 +179,7 @@ class Front(ABC):
         """
 
         median_best = 'MEDIAN' if median else 'BEST'
-        fronts_paths = [f"{self.fronts_path}/{algorithm}/{instance}/{median_best}_{self.metric}_FUN.csv" for algorithm in self.algorithms]
+        fronts_paths = self._fronts_paths(instance, median_best)
         file_name = file_name if file_name else f"front_all_{instance}_{self.metric}_{median_best}.png"
 
         self._front(fronts_paths, instance)
@@ -154,10 +214,19 @@ class Front(ABC):
         """
 
         median_best = 'MEDIAN' if median else 'BEST'
-        fronts_paths = [f"{self.fronts_path}/{algorithm}/{instance}/{median_best}_{self.metric}_FUN.csv" for algorithm in self.algorithms]
+        fronts_paths = self._fronts_paths(instance, median_best)
         self._front(fronts_paths, instance)
         plt.show()
 
+    def _fronts_paths(self, instance: str, median_best: str) -> list:
+        """Returns the paths of the fronts of every algorithm for an instance, building them only once."""
+
+        if (instance, median_best) not in self._front_paths:
+            self._front_paths[(instance, median_best)] = [
+                f"{self.fronts_path}/{algorithm}/{instance}/{median_best}_{self.metric}_FUN.csv" for algorithm in self.algorithms
+            ]
+        return self._front_paths[(instance, median_best)]
+
     @abstractmethod
     def _front(self, front_paths: list, instance: str) -> None:
         """Abstract method to generate a Pareto front for the specified instance."""
@@ -175,6 +244,9 @@ class Front2D(Front):
         # Veriffy that the number of front_paths and algorithms are the same
         if len(front_paths) != len(self.algorithms):
             raise ValueError("The paths and algorithms lists must have the same length.")
+
+        # Read the reference front and the fronts of every algorithm before creating the figure
+        fronts = _read_fronts([f"{self.references_path}/{instance}.{self.dimensions}D.csv"] + front_paths)
                 
         # Number of plots
         num_plots = len(front_paths) + 1
@@ -184,21 +256,15 @@ class Front2D(Front):
         _, axes = plt.subplots(rows, cols, figsize=(cols*6, rows*6))
         axes = axes.flatten()  
 
-        for i, (front_path, algorithm) in enumerate(zip([f"{self.references_path}/{instance}.{self.dimensions}D.csv"] + front_paths, ["Reference"] + self.algorithms)):
-            if not os.path.exists(front_path):
-                raise FileNotFoundError(f"Front {front_path} not found")
+        for i, (front, algorithm) in enumerate(zip(fronts, ["Reference"] + self.algorithms)):
+            x, y = front[0], front[1]
             
-            # Read the front
-            df = pd.read_csv(front_path, header=None)
-            x, y = df[0], df[1]
-            
-            # Create the plot
+            # Create the plot, drawing the points as the markers of a single line (same size as the scatter default)
             ax = axes[i]
-            ax.scatter(x, y, alpha=0.7, color='red' if algorithm == "Reference" else 'blue')
+            ax.plot(x, y, linestyle='None', marker='o', markersize=6, alpha=0.7, color='red' if algorithm == "Reference" else 'blue')
             
             # Personalize the plot
-            ax.spines['top'].set_visible(False)
-            ax.spines['right'].set_visible(False)
+            ax.spines[['top', 'right']].set_visible(False)
             ax.tick_params(axis='both', which='both', length=0)
             ax.set_title(algorithm, pad=20)
             ax.grid(True, alpha=0.3)
@@ -218,6 +284,9 @@ class Front3D(Front):
         # Veriffy that the number of front_paths and algorithms are the same
         if len(front_paths) != len(self.algorithms):
             raise ValueError("The paths and algorithms lists must have the same length.")
+
+        # Read the reference front and the fronts of every algorithm before creating the figure
+        fronts = _read_fronts([f"{self.references_path}/{instance}.{self.dimensions}D.csv"] + front_paths)
     
         # Número de gráficos
         num_plots = len(front_paths) + 1
@@ -226,17 +295,12 @@ class Front3D(Front):
         
         fig = plt.figure(figsize=(cols * 6, rows * 6))
         
-        for i, (front_path, algorithm) in enumerate(zip([f"{self.references_path}/{instance}.{self.dimensions}D.csv"] + front_paths, ["Reference"] + self.algorithms)):
-            if not os.path.exists(front_path):
-                raise FileNotFoundError(f"Front {front_path} not found")
+        for i, (front, algorithm) in enumerate(zip(fronts, ["Reference"] + self.algorithms)):
+            x, y, z = front[0], front[1], front[2]
             
-            # Read the front
-            df = pd.read_csv(front_path, header=None)
-            x, y, z = df[0], df[1], df[2]
-            
-            # Create the plot
+            # Create the plot, without depth shading so the colour of every point is not recomputed at each draw
             ax = fig.add_subplot(rows, cols, i + 1, projection='3d')
-            ax.scatter(x, y, z, alpha=0.7, color='red' if algorithm == "Reference" else 'blue')
+            ax.scatter(x, y, z, alpha=0.7, color='red' if algorithm == "Reference" else 'blue', depthshade=False)
             
             # Personalize the plot
             ax.set_title(algorithm, pad=20)
@@ -263,6 +327,9 @@ class FrontND(Front):
         # Veriffy that the number of front_paths and algorithms are the same
         if len(front_paths) != len(self.algorithms):
             raise ValueError("The paths and algorithms lists must have the same length.")
+
+        # Read the reference front and the fronts of every algorithm before creating the figure
+        fronts = _read_fronts([f"{self.references_path}/{instance}.{self.dimensions}D.csv"] + front_paths)
     
         # Number of plots
         num_plots = len(front_paths) + 1
@@ -272,18 +339,21 @@ class FrontND(Front):
         _, axes = plt.subplots(rows, cols, figsize=(cols * 6, rows * 6))
         axes = axes.flatten()
         
-        for i, (front_path, algorithm) in enumerate(zip([f"{self.references_path}/{instance}.{self.dimensions}D.csv"] + front_paths, ["Reference"] + self.algorithms)):
-            if not os.path.exists(front_path):
-                raise FileNotFoundError(f"Front {front_path} not found")
-            
-            # Read the front
-            df = pd.read_csv(front_path, header=None, names=[f"f{j}" for j in range(self.dimensions)])
-            df["Name"] = "Value"
-
-            # Create the plot
-            pd.plotting.parallel_coordinates(df, 'Name', color = ('red') if algorithm == "Reference" else ('blue'), ax=axes[i])
+        objectives = np.arange(self.dimensions)
+        for i, (front, algorithm) in enumerate(zip(fronts, ["Reference"] + self.algorithms)):
+            # One (objectives x 2) polyline per point, all drawn by a single collection instead of one line each
+            polylines = np.stack(np.broadcast_arrays(objectives[:, None], front[:self.dimensions]), axis=-1).transpose(1, 0, 2)
+            axes[i].add_collection(LineCollection(polylines, colors='red' if algorithm == "Reference" else 'blue'))
+            axes[i].autoscale_view()
+
+            # Create the parallel coordinates axes
+            for objective in objectives:
+                axes[i].axvline(objective, linewidth=1, color="black")
+            axes[i].set_xticks(objectives)
+            axes[i].set_xticklabels([f"f{j}" for j in objectives])
+            axes[i].set_xlim(objectives[0], objectives[-1])
+            axes[i].grid(True)
             axes[i].set_title(algorithm)
-            axes[i].get_legend().remove()
 
         # Remove empty plots
         plt.tight_layout()
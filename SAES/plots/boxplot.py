@@ -1,8 +1,8 @@
 from SAES.utils.dataframe_processor import process_dataframe_metric
 from SAES.logger import get_logger
 
+from functools import cached_property
 import matplotlib.pyplot as plt
-import seaborn as sns
 import pandas as pd
 import numpy as np
 import os
@@ -41,6 +41,17 @@ class Boxplot:
             Generates a boxplot for all instances and displays it.
     """
 
+    # Styling of the boxes of every subplot, the same as the seaborn boxplots used before (including the dark gray
+    # edge of the outliers)
+    _BOX_STYLE = {
+        "widths": 0.8, "capwidths": 0.4, "patch_artist": True, "manage_ticks": False,
+        "boxprops": {"facecolor": (0, 0, 1, 0.3), "edgecolor": "darkblue", "linewidth": 1.5, "linestyle": "solid"},
+        "whiskerprops": {"color": "darkblue", "linewidth": 1.5, "solid_capstyle": "butt"},
+        "capprops": {"color": "darkblue", "linewidth": 1.5},
+        "medianprops": {"color": "red", "linewidth": 1.5, "solid_capstyle": "butt"},
+        "flierprops": {"marker": 'o', "color": 'red', "markersize": 5, "alpha": 0.8, "markeredgecolor": (0.248, 0.248, 0.248)}
+    }
+
     def __init__(self, data: pd.DataFrame, metrics: pd.DataFrame, metric: str) -> None:
         """
         Initializes the Boxplot object with the given data, metrics, and metric.
@@ -69,9 +80,14 @@ class Boxplot:
 
         self.data, _ = process_dataframe_metric(data, metrics, metric)
         self.metric = metric
-        self.instances = self.data['Instance'].unique()
         self.logger = get_logger(__name__)
 
+        # Keep the instances and algorithms as integer codes (numbered in order of appearance) next to the metric values
+        self._instance_codes, instances = pd.factorize(self.data['Instance'])
+        self._algorithm_codes, self._algorithms = pd.factorize(self.data['Algorithm'])
+        self._values = self.data['MetricValue'].to_numpy()
+        self.instances = instances.to_numpy()
+
     def save_instance(self, instance: str, output_path: str, file_name: str = None, width: int = 8) -> None:
         """
         Generates a boxplot for the specified instance and saves it to the specified output path.
@@ -201,17 +217,11 @@ class Boxplot:
     def _plot_instance(self, instance: str, width: int) -> None:
         """Generates a boxplot for the specified instance."""
 
-        dataframe_instance = self.data[self.data["Instance"] == instance]
-
         plt.figure(figsize=(width, width * (4.5 / 8)))  
-        sns.boxplot(
-            x='Algorithm', y='MetricValue', data=dataframe_instance, 
-            boxprops=dict(facecolor=(0, 0, 1, 0.3), edgecolor="darkblue", linewidth=1.5),  
-            whiskerprops=dict(color="darkblue", linewidth=1.5),  
-            capprops=dict(color="darkblue", linewidth=1.5),  
-            medianprops=dict(color="red", linewidth=1.5),  
-            flierprops=dict(marker='o', color='red', markersize=5, alpha=0.8)  
-        )
+
+        # An instance missing from the data leaves the axes empty, as seaborn does for an empty selection
+        if instance in self._metric_values:
+            self._boxplot(plt.gca(), self._metric_values[instance])
 
         plt.title(f'Comparison of Algorithms for {instance} for {self.metric}', fontsize=16, weight='bold', pad=20)
         plt.ylabel(f'{self.metric}', fontsize=12, weight='bold')
@@ -219,52 +229,68 @@ class Boxplot:
         plt.yticks(fontsize=10, weight='bold')
         plt.grid(axis='y', linestyle='-', alpha=0.7)
 
-        plt.gca().spines['top'].set_visible(False)
-        plt.gca().spines['right'].set_visible(False)
-        plt.gca().spines['left'].set_visible(False)
-        plt.gca().spines['bottom'].set_visible(False)
+        plt.gca().spines[['top', 'right', 'left', 'bottom']].set_visible(False)
 
         plt.tick_params(axis='x', which='both', bottom=False, top=False, labelbottom=True)
         plt.gca().set_xlabel('')
         plt.tight_layout()
 
     def _plot_all_instances(self, width: int) -> None:
-        instances = self.data["Instance"].unique()
-        n_cols = 3 if len(instances) >= 3 else len(instances)
-        n_rows = int(np.ceil(len(instances) / n_cols))  
+        n_cols = 3 if len(self.instances) >= 3 else len(self.instances)
+        n_rows = int(np.ceil(len(self.instances) / n_cols))  
 
-        fig, axes = plt.subplots(n_rows, n_cols, figsize=(width, width * (n_rows / 4)))
+        # Add only the axes of the instances to the grid, instead of deleting the unused ones afterwards
+        fig = plt.figure(figsize=(width, width * (n_rows / 4)))
+        grid = fig.add_gridspec(n_rows, n_cols)
+        axes = [fig.add_subplot(grid[i // n_cols, i % n_cols]) for i in range(len(self.instances))]
 
-        if isinstance(axes, np.ndarray):
-            axes = axes.flatten()
-        else:
-            axes = [axes]
-
-        for i, instance in enumerate(instances):
-            dataframe_instance = self.data[self.data["Instance"] == instance]
+        # The data is grouped once for every instance and algorithm instead of being filtered for every instance
+        for i, (instance, values_by_algorithm) in enumerate(self._metric_values.items()):
             
-            sns.boxplot(
-                x='Algorithm', y='MetricValue', data=dataframe_instance, ax=axes[i],
-                boxprops=dict(facecolor=(0, 0, 1, 0.3), edgecolor="darkblue", linewidth=1.5),
-                whiskerprops=dict(color="darkblue", linewidth=1.5),
-                capprops=dict(color="darkblue", linewidth=1.5),
-                medianprops=dict(color="red", linewidth=1.5),
-                flierprops=dict(marker='o', color='red', markersize=5, alpha=0.8)
-            )
+            self._boxplot(axes[i], values_by_algorithm, rotation=15, fontsize=9, weight='bold')
             
             axes[i].set_title(f'Instance: {instance}', fontsize=12, weight='bold')
             axes[i].set_ylabel(f'{self.metric}', fontsize=10, weight='bold')
-            axes[i].set_xticks(range(len(dataframe_instance['Algorithm'].unique())))
-            axes[i].set_xticklabels(dataframe_instance['Algorithm'].unique(), rotation=15, fontsize=9, weight='bold')
             
             axes[i].grid(axis='y', linestyle='-', alpha=0.7)
-            axes[i].spines['top'].set_visible(False)
-            axes[i].spines['right'].set_visible(False)
-            axes[i].spines['left'].set_visible(False)
-            axes[i].spines['bottom'].set_visible(False)
+            axes[i].spines[['top', 'right', 'left', 'bottom']].set_visible(False)
             axes[i].tick_params(axis='x', bottom=False)
 
-        for j in range(i + 1, len(axes)):
-            fig.delaxes(axes[j])
-
         plt.subplots_adjust(left=0.1, right=0.9, bottom=0.1, top=0.9, wspace=0.35, hspace=0.45)
+
+    @cached_property
+    def _metric_values(self) -> dict:
+        """The metric values grouped by instance and algorithm in their order of appearance, with one sort of the data."""
+
+        # Number the (instance, algorithm) pairs in order of appearance
+        n_algorithms = len(self._algorithms)
+        pair_codes, pairs = pd.factorize(self._instance_codes * n_algorithms + self._algorithm_codes)
+
+        # Sort the rows by instance and pair (keeping their order within a pair) and split them where the pair changes
+        order = np.lexsort((pair_codes, self._instance_codes))
+        sorted_pairs = pair_codes[order]
+        starts = np.flatnonzero(np.r_[True, sorted_pairs[1:] != sorted_pairs[:-1]])
+        groups = np.split(self._values[order], starts[1:])
+
+        metric_values = {}
+        for pair, values in zip(sorted_pairs[starts], groups):
+            instance, algorithm = divmod(pairs[pair], n_algorithms)
+            metric_values.setdefault(self.instances[instance], {})[self._algorithms[algorithm]] = values
+        return metric_values
+
+    def _boxplot(self, ax: plt.Axes, values_by_algorithm: dict, **label_kwargs) -> None:
+        """Draws the boxes of every algorithm of an instance in the given order, laid out as seaborn's boxplot."""
+
+        values = list(values_by_algorithm.values())
+        algorithms = list(values_by_algorithm)
+        positions = np.arange(len(algorithms))
+
+        ax.boxplot(values, positions=positions, **self._BOX_STYLE)
+
+        # Categorical axis with one tick per algorithm
+        ax.set_xticks(positions)
+        ax.set_xticklabels(algorithms, **label_kwargs)
+        ax.set_xlim(-0.5, len(algorithms) - 0.5)
+        ax.xaxis.grid(False)
+        ax.set_xlabel('Algorithm')
+        ax.set_ylabel('MetricValue')
@@ -1,8 +1,7 @@
-from SAES.statistical_tests.non_parametrical import NemenyiCD
+from SAES.statistical_tests.non_parametrical import NemenyiCD, ranks
 from SAES.latex_generation.stats_table import MeanMedian
 from SAES.logger import get_logger
 
-from scipy.stats import rankdata
 import matplotlib.pyplot as plt
 import pandas as pd
 import numpy as np
@@ -10,6 +9,28 @@ import os
 
 # Scientific article reference: https://www.jmlr.org/papers/volume7/demsar06a/demsar06a.pdf
 
+def _join_alg(avranks: np.ndarray, num_alg: int, cd: float) -> np.ndarray:
+    """join_alg returns the set of non significant methods of the sorted average ranks."""
+
+    # When the whole range of ranks is within the cd (the usual case with few algorithms), the first and last
+    # algorithms make the only group
+    if 0 < avranks[-1] - avranks[0] < cd:
+        return avranks[[0, -1]]
+
+    # get all pairs, joining every algorithm with the last one whose rank is higher by less than the cd
+    differences = avranks[None, :] - avranks[:, None]
+    joined = (differences > 0) & (differences < cd)
+    last = num_alg - 1 - joined[:, ::-1].argmax(axis=1)
+    sets = np.column_stack((avranks, avranks[last]))[joined.any(axis=1)]
+    if sets.size == 0:
+        return sets
+
+    # group pairs, keeping the first one and every pair that reaches further than the previous one
+    group = sets[np.r_[True, sets[:-1, 1] < sets[1:, 1]]]
+
+    # A single pair is returned as a 1-D array
+    return group[0] if group.shape[0] == 1 else group
+
 class CDplot:
     """
     Class to generate a critical difference plot to compare the performance of different algorithms on multiple instances.
@@ -131,27 +152,6 @@ class CDplot:
     def _plot(self, width: int, alpha: float = 0.05) -> None:
         """Creates a critical distance plot to compare the performance of different algorithms on the different instances."""
 
-        def _join_alg(avranks, num_alg, cd):
-            """join_alg returns the set of non significant methods."""
-
-            # get all pairs
-            sets = (-1) * np.ones((num_alg, 2))
-            for i in range(num_alg):
-                elements = np.where(np.logical_and(avranks - avranks[i] > 0, avranks - avranks[i] < cd))[0]
-                if elements.size > 0:
-                    sets[i, :] = [avranks[i], avranks[elements[-1]]]
-            sets = np.delete(sets, np.where(sets[:, 0] < 0)[0], axis=0)
-            if sets.size == 0:
-                return sets
-            
-            # group pairs
-            group = sets[0, :]
-            for i in range(1, sets.shape[0]):
-                if sets[i - 1, 1] < sets[i, 1]:
-                    group = np.vstack((group, sets[i, :]))
-
-            return group
-        
         alg_names = self.table.columns
         data = self.table.values
 
@@ -163,24 +163,24 @@ class CDplot:
         # Get the critical difference
         cd = NemenyiCD(alpha, num_alg, num_dataset)
 
-        # Compute ranks. (ranks[i][j] rank of the i-th algorithm on the j-th Instance.)
-        rranks = rankdata(-data, axis=1) if self.maximize else rankdata(data, axis=1)
+        # Compute ranks, averaging ties as the Friedman tests do. (ranks[i][j] rank of the i-th algorithm on the j-th Instance.)
+        rranks = ranks(data, maximize=bool(self.maximize))
 
         # Compute for each algorithm the ranking averages.
         avranks = np.transpose(np.mean(rranks, axis=0))
-        indices = np.argsort(avranks).astype(np.uint8)
+        indices = np.argsort(avranks)
         avranks = avranks[indices]
 
         # Split algorithms.
-        spoint = np.round(num_alg / 2.0).astype(np.uint8)
+        spoint = int(np.round(num_alg / 2.0))
         leftalg = avranks[:spoint]
 
         rightalg = avranks[spoint:]
-        rows = np.ceil(num_alg / 2.0).astype(np.uint8)
+        rows = int(np.ceil(num_alg / 2.0))
 
-        # Figure settings.
-        highest = np.ceil(np.max(avranks)).astype(np.uint8)  # highest shown rank
-        lowest = np.floor(np.min(avranks)).astype(np.uint8)  # lowest shown rank
+        # Figure settings, as plain ints so they neither overflow nor promote the arithmetic below to NumPy scalars
+        lowest = int(np.floor(np.min(avranks)))  # lowest shown rank
+        highest = max(int(np.ceil(np.max(avranks))), lowest + 1)  # highest shown rank, at least one rank above
 
         # Compute figure size
         height = width * (0.8625 * (rows + 1) / 9)
@@ -219,62 +219,35 @@ class CDplot:
 
         # Main horizontal axis
         ax.hlines(stop, sleft, sright, color="black", linewidth=3)
-        for xi in range(highest - lowest + 1):
-            # Plot mayor ticks
-            ax.vlines(
-                x=sleft + (lline * xi) / (highest - lowest), ymin=stop, ymax=stop + 0.05, color="black", linewidth=2
-            )
-            # Mayor ticks labels
-            ax.text(
-                x=sleft + (lline * xi) / (highest - lowest), y=stop + 0.06, s=str(lowest + xi), ha="center", va="bottom"
-            )
-            # Minor ticks
-            if xi < highest - lowest:
-                ax.vlines(
-                    x=sleft + (lline * (xi + 0.5)) / (highest - lowest),
-                    ymin=stop,
-                    ymax=stop + 0.025,
-                    color="black",
-                    linewidth=0.7,
-                )
 
-        # Plot lines/names for left models
+        # Major ticks at every rank and minor ticks halfway between them, each set drawn with a single call
+        tick_ranks = np.arange(highest - lowest + 1)
+        tick_x = sleft + (lline * tick_ranks) / (highest - lowest)
+        ax.vlines(x=tick_x, ymin=stop, ymax=stop + 0.05, color="black", linewidth=2)
+        ax.vlines(x=sleft + (lline * (tick_ranks[:-1] + 0.5)) / (highest - lowest), ymin=stop, ymax=stop + 0.025, color="black", linewidth=0.7)
+
+        # Mayor ticks labels
+        for xi, x in enumerate(tick_x):
+            ax.text(x=x, y=stop + 0.06, s=str(lowest + xi), ha="center", va="bottom")
+
+        # Plot lines/names for left models, drawing the lines of all of them with one collection per direction
+        sorted_names = alg_names[indices]
         vspace = 0.5 * (stop - sbottom) / (spoint + 1)
+        left_x = sleft + (lline * (leftalg - lowest)) / (highest - lowest)
+        left_y = sbottom + (spoint - 1 - np.arange(spoint)) * vspace
+        ax.vlines(x=left_x, ymin=left_y, ymax=stop, color="red", linewidth=1)
+        ax.hlines(y=left_y, xmin=sleft, xmax=left_x, color="red", linewidth=1)
         for i in range(spoint):
-            ax.vlines(
-                x=sleft + (lline * (leftalg[i] - lowest)) / (highest - lowest),
-                ymin=sbottom + (spoint - 1 - i) * vspace,
-                ymax=stop,
-                color="red",
-                linewidth=1,
-            )
-            ax.hlines(
-                y=sbottom + (spoint - 1 - i) * vspace,
-                xmin=sleft,
-                xmax=sleft + (lline * (leftalg[i] - lowest)) / (highest - lowest),
-                color="red",
-                linewidth=1,
-            )
-            ax.text(x=sleft - 0.01, y=sbottom + (spoint - 1 - i) * vspace, s=f"$\\mathbf{{{alg_names[indices][i]}}}$", ha="right", va="center")
+            ax.text(x=sleft - 0.01, y=left_y[i], s=f"$\\mathbf{{{sorted_names[i]}}}$", ha="right", va="center")
 
         # Plot lines/names for right models
         vspace = 0.5 * (stop - sbottom) / (num_alg - spoint + 1)
+        right_x = sleft + (lline * (rightalg - lowest)) / (highest - lowest)
+        right_y = sbottom + np.arange(num_alg - spoint) * vspace
+        ax.vlines(x=right_x, ymin=right_y, ymax=stop, color="green", linewidth=1)
+        ax.hlines(y=right_y, xmin=right_x, xmax=sright, color="green", linewidth=1)
         for i in range(num_alg - spoint):
-            ax.vlines(
-                x=sleft + (lline * (rightalg[i] - lowest)) / (highest - lowest),
-                ymin=sbottom + i * vspace,
-                ymax=stop,
-                color="green",
-                linewidth=1,
-            )
-            ax.hlines(
-                y=sbottom + i * vspace,
-                xmin=sleft + (lline * (rightalg[i] - lowest)) / (highest - lowest),
-                xmax=sright,
-                color="green",
-                linewidth=1,
-            )
-            ax.text(x=sright + 0.01, y=sbottom + i * vspace, s=f"$\\mathbf{{{alg_names[indices][spoint+i]}}}$", ha="left", va="center")
+            ax.text(x=sright + 0.01, y=right_y[i], s=f"$\\mathbf{{{sorted_names[spoint+i]}}}$", ha="left", va="center")
 
         # Plot critical difference rule
         if sleft + (cd * lline) / (highest - lowest) <= sright:
@@ -295,29 +268,27 @@ class CDplot:
                 left_lines = np.reshape(nonsig[0, :], (1, 2))
                 right_lines = np.reshape(nonsig[1, :], (1, 2))
             else:
-                left_lines = nonsig[: np.round(nonsig.shape[0] / 2.0).astype(np.uint8), :]
-                right_lines = nonsig[np.round(nonsig.shape[0] / 2.0).astype(np.uint8) :, :]
+                left_lines = nonsig[: int(np.round(nonsig.shape[0] / 2.0)), :]
+                right_lines = nonsig[int(np.round(nonsig.shape[0] / 2.0)) :, :]
         else:
             left_lines = np.reshape(nonsig, (1, nonsig.shape[0]))
 
         if nonsig.size > 0:
-            # plot from the left
+            # plot from the left, all the lines of a side with a single call
             vspace = 0.5 * (stop - sbottom) / (left_lines.shape[0] + 1)
-            for i in range(left_lines.shape[0]):
-                ax.hlines(
-                    y=stop - (i + 1) * vspace,
-                    xmin=sleft + lline * (left_lines[i, 0] - lowest - 0.025) / (highest - lowest),
-                    xmax=sleft + lline * (left_lines[i, 1] - lowest + 0.025) / (highest - lowest),
-                    linewidth=2,
-                )
+            ax.hlines(
+                y=stop - np.arange(1, left_lines.shape[0] + 1) * vspace,
+                xmin=sleft + lline * (left_lines[:, 0] - lowest - 0.025) / (highest - lowest),
+                xmax=sleft + lline * (left_lines[:, 1] - lowest + 0.025) / (highest - lowest),
+                linewidth=2,
+            )
 
             # plot from the rigth
             if nonsig.ndim == 2:
                 vspace = 0.5 * (stop - sbottom) / (left_lines.shape[0])
-                for i in range(right_lines.shape[0]):
-                    ax.hlines(
-                        y=stop - (i + 1) * vspace,
-                        xmin=sleft + lline * (right_lines[i, 0] - lowest - 0.025) / (highest - lowest),
-                        xmax=sleft + lline * (right_lines[i, 1] - lowest + 0.025) / (highest - lowest),
-                        linewidth=2,
-                    )
+                ax.hlines(
+                    y=stop - np.arange(1, right_lines.shape[0] + 1) * vspace,
+                    xmin=sleft + lline * (right_lines[:, 0] - lowest - 0.025) / (highest - lowest),
+                    xmax=sleft + lline * (right_lines[:, 1] - lowest + 0.025) / (highest - lowest),
+                    linewidth=2,
+                )
@@ -207,8 +207,11 @@ class HistoPlot:
         
         plt.figure(figsize=(width, width * (4.5 / 8)))  
 
+        # Split the instance by algorithm in one pass instead of filtering it for every algorithm (an algorithm without
+        # rows gets an empty frame, so it still takes its color and the following ones keep theirs)
+        dataframes_algorithm = dict(tuple(dataframe_instance.groupby('Algorithm', sort=False, observed=True)))
         for algorithm in self.algorithms:
-            dataframe_algorithm = dataframe_instance[dataframe_instance['Algorithm'] == algorithm]
+            dataframe_algorithm = dataframes_algorithm.get(algorithm, dataframe_instance.iloc[:0])
 
             if dataframe_algorithm['MetricValue'].eq(0).all():
                 dataframe_algorithm.loc[:, 'MetricValue'] += np.random.uniform(0.00001, 0.00002, size=len(dataframe_algorithm))
@@ -224,10 +227,7 @@ class HistoPlot:
         plt.yticks(fontsize=10, weight='bold')
         plt.grid(axis='y', linestyle='-', alpha=0.7)
 
-        plt.gca().spines['top'].set_visible(False)
-        plt.gca().spines['right'].set_visible(False)
-        plt.gca().spines['left'].set_visible(False)
-        plt.gca().spines['bottom'].set_visible(False)
+        plt.gca().spines[['top', 'right', 'left', 'bottom']].set_visible(False)
 
         plt.tick_params(axis='x', which='both', bottom=False, top=False, labelbottom=True)
         plt.tight_layout()
@@ -235,25 +235,24 @@ class HistoPlot:
     def _plot_all_instances(self, width: int) -> None:
         """Generates a histoplot for all instances."""
 
-        instances = self.data["Instance"].unique()
-        n_cols = 3 if len(instances) >= 3 else len(instances)
-        n_rows = int(np.ceil(len(instances) / n_cols))  
+        n_cols = 3 if len(self.instances) >= 3 else len(self.instances)
+        n_rows = int(np.ceil(len(self.instances) / n_cols))  
 
-        fig, axes = plt.subplots(n_rows, n_cols, figsize=(width, width * (n_rows / 4)))
+        # Add only the axes of the instances to the grid, instead of deleting the unused ones afterwards
+        fig = plt.figure(figsize=(width, width * (n_rows / 4)))
+        grid = fig.add_gridspec(n_rows, n_cols)
+        axes = [fig.add_subplot(grid[i // n_cols, i % n_cols]) for i in range(len(self.instances))]
 
-        if isinstance(axes, np.ndarray):
-            axes = axes.flatten()
-        else:
-            axes = [axes]
-
-        for i, instance in enumerate(instances):
-            dataframe_instance = self.data[self.data["Instance"] == instance].copy()
-            dataframe_instance.drop(columns=['index', 'Instance', 'ExecutionId'], inplace=True)
+        # Group the data once instead of filtering it for every instance
+        for i, (instance, dataframe_instance) in enumerate(self.data.groupby("Instance", sort=False, observed=True)):
+            dataframe_instance = dataframe_instance.drop(columns=['index', 'Instance', 'ExecutionId'])
+            dataframes_algorithm = dict(tuple(dataframe_instance.groupby('Algorithm', sort=False, observed=True)))
             
             for algorithm in self.algorithms:
-                dataframe_algorithm = dataframe_instance[dataframe_instance['Algorithm'] == algorithm].copy()
+                dataframe_algorithm = dataframes_algorithm.get(algorithm, dataframe_instance.iloc[:0]).copy()
                 
-                if (dataframe_algorithm['MetricValue'] == dataframe_algorithm['MetricValue'].iloc[0]).all():
+                values = dataframe_algorithm['MetricValue']
+                if not values.empty and (values == values.iloc[0]).all():
                     dataframe_algorithm.loc[:, 'MetricValue'] += np.random.uniform(0.00001, 0.00002, size=len(dataframe_algorithm))
                 
                 sns.histplot(dataframe_algorithm['MetricValue'], kde=True, label=algorithm, element='bars', ax=axes[i])
@@ -263,13 +262,7 @@ class HistoPlot:
             axes[i].set_ylabel('Frequency', fontsize=10, weight='bold')
             axes[i].set_xlabel(f'{self.metric}', fontsize=10, weight='bold')            
             axes[i].grid(axis='y', linestyle='-', alpha=0.7)
-            axes[i].spines['top'].set_visible(False)
-            axes[i].spines['right'].set_visible(False)
-            axes[i].spines['left'].set_visible(False)
-            axes[i].spines['bottom'].set_visible(False)
+            axes[i].spines[['top', 'right', 'left', 'bottom']].set_visible(False)
             axes[i].tick_params(axis='x', bottom=False)
 
-        for j in range(i + 1, len(axes)):
-            fig.delaxes(axes[j])
-
         plt.subplots_adjust(left=0.1, right=0.9, bottom=0.1, top=0.9, wspace=0.35, hspace=0.45)
\ No newline at end of file
@@ -3,6 +3,7 @@ from SAES.utils.dataframe_processor import process_dataframe_metric
 from SAES.logger import get_logger
 
 from matplotlib import pyplot as plt
+from functools import cached_property
 import pandas as pd
 import numpy as np
 
@@ -407,31 +408,22 @@ class Pplot:
     def _obtain_posterior_probabilities(self, alg1: str, alg2: str, sample_size: int) -> np.array:
         """Obtains the posterior probabilities of the Bayesian statistical test between two algorithms."""
 
-        # Filter data to include only the specified algorithms
-        data = self.data[self.data['Algorithm'].isin([alg1, alg2])]
-        execution_min = data['ExecutionId'].min()
-        execution_max = data['ExecutionId'].max() + 1
+        # Take the columns of both algorithms from the data pivoted once, keeping the rows where any of them has a value
+        data = self._execution_values[[alg1, alg2]].dropna(how='all')
 
-        # Initialize an empty list to store posterior probabilities
+        # Compute the posterior probabilities of every execution and stack them once
         posterior_probabilities = []
-        for i in range(execution_min, execution_max):
-            # Filter data for the current execution
-            data_i = data[data['ExecutionId'] == i]
-            data_i = data_i.pivot(index='Instance', columns='Algorithm', values='MetricValue')
-            data_i = data_i[[alg1, alg2]]
-
-            # If it's the first iteration, initialize the posterior probabilities list
+        for _, data_i in data.groupby(level='ExecutionId'):
             if self.bayesian_test == "sign":
-                test_results = bayesian_sign_test(data_i.values, sample_size=sample_size)[1]
-            else:
-                test_results = bayesian_signed_rank_test(data_i.values, sample_size=sample_size)[1]
-            
-            if len(posterior_probabilities) == 0:
-                posterior_probabilities = test_results
+                posterior_probabilities.append(bayesian_sign_test(data_i.values, sample_size=sample_size)[1])
             else:
-                # For subsequent iterations, stack the new posterior probabilities with the previous ones
-                posterior_probabilities = np.vstack((posterior_probabilities, test_results))
+                posterior_probabilities.append(bayesian_signed_rank_test(data_i.values, sample_size=sample_size)[1])
 
         # Return the posterior probabilities as a NumPy array
-        return np.array(posterior_probabilities)
-    
\ No newline at end of file
+        return np.vstack(posterior_probabilities)
+    
+
+    @cached_property
+    def _execution_values(self) -> pd.DataFrame:
+        """The metric values pivoted once to one row per execution and instance and one column per algorithm."""
+        return self.data.pivot(index=['ExecutionId', 'Instance'], columns='Algorithm', values='MetricValue')
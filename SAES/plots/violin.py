@@ -205,8 +205,8 @@ class Violin:
     def _plot_instance(self, instance: str, width: int) -> None:
         """Generates a violin for the specified instance."""
 
-        dataframe_instance = self.data[self.data["Instance"] == instance]
-        metric_values_by_algorithm = dataframe_instance.groupby("Algorithm")["MetricValue"].apply(list).loc[self.algorithms].tolist()
+        values_by_algorithm = self._metric_values(self.data[self.data["Instance"] == instance])[instance]
+        metric_values_by_algorithm = [values_by_algorithm[algorithm] for algorithm in self.algorithms]
         plt.figure(figsize=(width, width * (4.5 / 8))) 
         sns.violinplot(data=metric_values_by_algorithm, palette=["#5B92E5"] * len(self.algorithms))
     
@@ -217,10 +217,7 @@ class Violin:
         plt.yticks(fontsize=10, weight='bold')
         plt.grid(axis='y', linestyle='-', alpha=0.7)
 
-        plt.gca().spines['top'].set_visible(False)
-        plt.gca().spines['right'].set_visible(False)
-        plt.gca().spines['left'].set_visible(False)
-        plt.gca().spines['bottom'].set_visible(False)
+        plt.gca().spines[['top', 'right', 'left', 'bottom']].set_visible(False)
 
         plt.tick_params(axis='x', which='both', bottom=False, top=False, labelbottom=True)
         plt.gca().set_xlabel('')
@@ -229,38 +226,36 @@ class Violin:
     def _plot_all_instances(self, width: int) -> None:
         """Generates a violin for all instances."""
         
-        instances = self.data["Instance"].unique()
-        n_cols = 3 if len(instances) >= 3 else len(instances)
-        n_rows = int(np.ceil(len(instances) / n_cols))  
+        n_cols = 3 if len(self.instances) >= 3 else len(self.instances)
+        n_rows = int(np.ceil(len(self.instances) / n_cols))  
 
-        fig, axes = plt.subplots(n_rows, n_cols, figsize=(width, width * (n_rows / 4)))
+        # Add only the axes of the instances to the grid, instead of deleting the unused ones afterwards
+        fig = plt.figure(figsize=(width, width * (n_rows / 4)))
+        grid = fig.add_gridspec(n_rows, n_cols)
+        axes = [fig.add_subplot(grid[i // n_cols, i % n_cols]) for i in range(len(self.instances))]
 
-        if isinstance(axes, np.ndarray):
-            axes = axes.flatten()
-        else:
-            axes = [axes]
-
-        for i, instance in enumerate(instances):
-            dataframe_instance = self.data[self.data["Instance"] == instance]
-            metric_values_by_algorithm = dataframe_instance.groupby("Algorithm")["MetricValue"].apply(list).loc[self.algorithms].tolist()
+        # Group the data once instead of filtering it for every instance
+        for i, (instance, values_by_algorithm) in enumerate(self._metric_values(self.data).items()):
+            metric_values_by_algorithm = [values_by_algorithm[algorithm] for algorithm in self.algorithms]
 
             # Plot violin for each instance
             sns.violinplot(data=metric_values_by_algorithm, palette=["#5B92E5"] * len(self.algorithms), ax=axes[i])
 
             axes[i].set_title(f'Instance: {instance}', fontsize=12, weight='bold')
             axes[i].set_ylabel(f'{self.metric}', fontsize=10, weight='bold')
-            axes[i].set_xticks(range(len(dataframe_instance['Algorithm'].unique())))
-            axes[i].set_xticklabels(dataframe_instance['Algorithm'].unique(), rotation=15, fontsize=9, weight='bold')
+            axes[i].set_xticks(range(len(values_by_algorithm)))
+            axes[i].set_xticklabels(list(values_by_algorithm), rotation=15, fontsize=9, weight='bold')
 
             axes[i].grid(axis='y', linestyle='-', alpha=0.7)
-            axes[i].spines['top'].set_visible(False)
-            axes[i].spines['right'].set_visible(False)
-            axes[i].spines['left'].set_visible(False)
-            axes[i].spines['bottom'].set_visible(False)
+            axes[i].spines[['top', 'right', 'left', 'bottom']].set_visible(False)
             axes[i].tick_params(axis='x', bottom=False)
 
-        # Remove extra axes if any
-        for j in range(i + 1, len(axes)):
-            fig.delaxes(axes[j])
-
         plt.subplots_adjust(left=0.1, right=0.9, bottom=0.1, top=0.9, wspace=0.35, hspace=0.45)
+
+    def _metric_values(self, data: pd.DataFrame) -> dict:
+        """Groups the metric values by instance and algorithm in one pass, keeping their order of appearance."""
+
+        metric_values = {}
+        for (instance, algorithm), values in data.groupby(["Instance", "Algorithm"], sort=False, observed=True)["MetricValue"]:
+            metric_values.setdefault(instance, {})[algorithm] = values.to_numpy()
+        return metric_values
@@ -26,7 +26,7 @@ Supported APV Procedures:
 import numpy as np
 import pandas as pd
 
-from SAES.statistical_tests.non_parametrical import _ranks
+from SAES.statistical_tests.non_parametrical import ranks
 from scipy.stats import rankdata, mannwhitneyu, chi2, binom, f, norm
 
 def friedman_ph_test(data: pd.DataFrame, maximize: bool, control=None, apv_procedure=None) -> pd.DataFrame:
@@ -89,7 +89,7 @@ def friedman_ph_test(data: pd.DataFrame, maximize: bool, control=None, apv_proce
             raise ValueError("Initialization ERROR. Incorrect value for APVprocedure.")
 
     # Compute ranks.
-    datarank = _ranks(data, maximize)
+    datarank = ranks(data, maximize)
     # Compute for each algorithm the ranking average.
     avranks = np.mean(datarank, axis=0)
 
@@ -190,7 +190,7 @@ def friedman_aligned_ph_test(data: pd.DataFrame, maximize: bool, control=None, a
     for j in range(k):
         diff[:, j] = data[:, j] - problemmean
 
-    alignedRanks = _ranks(np.ravel(diff), maximize)
+    alignedRanks = ranks(np.ravel(diff), maximize)
     alignedRanks = np.reshape(alignedRanks, newshape=(n_samples, k))
 
     # Average ranks
@@ -286,11 +286,11 @@ def quade_ph_test(data: pd.DataFrame, maximize: bool, control=None, apv_procedur
             raise ValueError("Initialization ERROR. %s is not a column name of data" % control)
 
     # Compute ranks.
-    datarank = _ranks(data, maximize)
+    datarank = ranks(data, maximize)
     # Compute the range of each problem
     problemRange = np.max(data, axis=1) - np.min(data, axis=1)
     # Compute problem rank
-    problemRank = _ranks(problemRange, maximize)
+    problemRank = ranks(problemRange, maximize)
 
     # Compute average rakings
     W = np.zeros((n_samples, k))
@@ -1,6 +1,6 @@
 from statsmodels.stats.libqsturng import qsturng
 from scipy.stats import wilcoxon as wx
-from scipy.stats import chi2, f
+from scipy.stats import chi2, f, rankdata
 import pandas as pd
 import numpy as np
 
@@ -10,50 +10,36 @@ warnings.filterwarnings("ignore", category=DeprecationWarning)
 # Article reference: https://www.statology.org/friedman-test-python/
 # Wikipedia reference: https://en.wikipedia.org/wiki/Mann%E2%80%93Whitney_U_test
 
-def _ranks(data: np.array, maximize: bool):
-    """Computes the rank of the elements in data."""
+def ranks(data: np.array, maximize: bool) -> np.ndarray:
+    """
+    Computes the rank of the elements in data, averaging ties.
+
+    Args:
+        data (np.array):
+            A 1D array, or a 2D array whose rows are ranked independently.
+
+        maximize (bool):
+            Whether the highest value gets rank 1. Only `False` ranks in ascending order.
+
+    Returns:
+        np.ndarray: The ranks of the elements, with the shape of data (None if data is not 1D or 2D).
+
+    Raises:
+        ValueError: If the data contains NaN values.
+    """
 
     # Set sorting order: ascending if maximize is False, descending if True
     s = 0 if (maximize is False) else 1
 
-    # Handle case for 2D arrays
-    if data.ndim == 2:
-        # Initialize ranks with ones
-        ranks = np.ones(data.shape)
-
-        # Iterate over each row
-        for i in range(data.shape[0]):
-            # Sort data in the desired order and extract unique values, their indices, and repetitions
-            values, indices, rep = np.unique(
-                (-1) ** s * np.sort((-1) ** s * data[i, :]),
-                return_index=True,
-                return_counts=True,
-            )
-
-            # Assign ranks to each element in the row
-            for j in range(data.shape[1]):
-                # ranks[i, j] += indices[values == data[i, j]] + 0.5 * (rep[values == data[i, j]] - 1)
-                ranks[i, j] += indices[values == data[i, j]].item() + 0.5 * (rep[values == data[i, j]].item() - 1)
-        return ranks
-    
-    # Handle case for 1D arrays
-    elif data.ndim == 1:
-        # Initialize ranks with ones
-        ranks = np.ones((data.size,))
-
-        # Sort data in the desired order and extract unique values, their indices, and repetitions
-        values, indices, rep = np.unique(
-            (-1) ** s * np.sort((-1) ** s * data),
-            return_index=True,
-            return_counts=True,
-        )
+    if data.ndim not in (1, 2):
+        return None
 
-        # Assign ranks to each element
-        for i in range(data.size):
-            # ranks[i] += indices[values == data[i]] + 0.5 * (rep[values == data[i]] - 1)
-            ranks[i] += indices[values == data[i]].item() + 0.5 * (rep[values == data[i]].item() - 1)
+    # Missing values cannot be ranked
+    if np.isnan(data).any():
+        raise ValueError("The data to rank contains NaN values.")
 
-        return ranks
+    # Average ranks of ties, computed for every row of 2D arrays (or for the whole 1D array) at once
+    return rankdata((-1) ** s * data, axis=-1)
 
 def friedman(data: pd.DataFrame, maximize: bool) -> pd.DataFrame:
     """
@@ -99,10 +85,10 @@ def friedman(data: pd.DataFrame, maximize: bool) -> pd.DataFrame:
 
     # Compute ranks, in the order specified by the maximize parameter
     # ranks = rankdata(-data, axis=1) if maximize else rankdata(data, axis=1)
-    ranks = _ranks(data, maximize)
+    data_ranks = ranks(data, maximize)
 
     # Calculate average ranks for each algorithm (column)
-    average_ranks = np.mean(ranks, axis=0)
+    average_ranks = np.mean(data_ranks, axis=0)
 
     # Compute the Friedman statistic
     rank_sum_squared = np.sum(n_samples * (average_ranks**2))
@@ -170,7 +156,7 @@ def friedman_aligned_rank(data: pd.DataFrame, maximize: bool) -> pd.DataFrame:
     diff = [data[:, j] - control for j in range(data.shape[1])]
     
     # Compute ranks of the aligned differences
-    alignedRanks = _ranks(np.ravel(diff), maximize)
+    alignedRanks = ranks(np.ravel(diff), maximize)
     alignedRanks = np.reshape(alignedRanks, newshape=(n_samples, k), order="F")
 
     # Compute sum of aligned ranks per instance and per algorithm
@@ -242,11 +228,11 @@ def quade(data: pd.DataFrame, maximize: bool) -> pd.DataFrame:
         raise ValueError("Initialization Error. Incorrect number of dimensions for axis 1.")
 
     # Compute ranks, in the order specified by the maximize parameter
-    datarank = _ranks(data, maximize)
+    datarank = ranks(data, maximize)
 
     # Compute the rank of the range of each problem
     problemRange = np.max(data, axis=1) - np.min(data, axis=1)
-    problemRank = _ranks(problemRange, maximize)
+    problemRank = ranks(problemRange, maximize)
 
     # Compute S_stat: weight of each observation within the problem, adjusted to reflect the significance of the problem when it appears.
     S_stat = np.zeros((n_samples, k))
@@ -282,7 +268,7 @@ def wilcoxon(data: pd.DataFrame, maximize: bool):
 
     Args:
         data (pd.DataFrame):
-            A DataFrame containing the performance results. Each row represents the performance of both algorithms on a instance. The DataFrame should have two columns, one for each algorithm.
+            A DataFrame containing the performance results. Each row represents the performance of both algorithms on a instance. The DataFrame should have two columns, one for each algorithm. A 2D array with the two columns in the same order is also accepted.
                 - Example:
             +-------+-------------+-------------+
             |   0   | Algorithm A | Algorithm B |
@@ -306,13 +292,18 @@ def wilcoxon(data: pd.DataFrame, maximize: bool):
             - "=" if both algorithms perform
     """
 
-    median_a = data["Algorithm A"].median()
-    median_b = data["Algorithm B"].median()
+    # Initial Checking
+    if isinstance(data, pd.DataFrame):
+        data = data[["Algorithm A", "Algorithm B"]].values
+
+    # SciPy receives each algorithm as a contiguous float64 array instead of a strided column
+    values_a, values_b = np.ascontiguousarray(np.asarray(data, dtype=np.float64).T)
 
     # Perform the Wilcoxon signed-rank test
     with warnings.catch_warnings():
         warnings.simplefilter("ignore", category=RuntimeWarning)
-        _, p_value = wx(data["Algorithm A"], data["Algorithm B"])
+        median_a, median_b = np.nanmedian(data, axis=0)
+        _, p_value = wx(values_a, values_b)
 
     # Determine the result based on the p-value
     alpha = 0.05
@@ -8,7 +8,7 @@ def t_test(data: pd.DataFrame, maximize: bool):
 
     Args:
         data (pd.DataFrame):
-            A DataFrame containing the performance results. Each row represents the performance of both algorithms on a instance. The DataFrame should have two columns, one for each algorithm.
+            A DataFrame containing the performance results. Each row represents the performance of both algorithms on a instance. The DataFrame should have two columns, one for each algorithm. A 2D array with the two columns in the same order is also accepted.
                 - Example:
             +-------+-------------+-------------+
             |   0   | Algorithm A | Algorithm B |
@@ -32,11 +32,17 @@ def t_test(data: pd.DataFrame, maximize: bool):
             - "=" if both algorithms perform
     """
 
-    mean_a = data["Algorithm A"].mean()
-    mean_b = data["Algorithm B"].mean()
+    # Initial Checking
+    if isinstance(data, pd.DataFrame):
+        data = data[["Algorithm A", "Algorithm B"]].values
+
+    mean_a, mean_b = np.nanmean(data, axis=0)
+
+    # SciPy receives each algorithm as a contiguous float64 array instead of a strided column
+    values_a, values_b = np.ascontiguousarray(np.asarray(data, dtype=np.float64).T)
 
     # Perform the T-Test signed-rank test
-    _, p_value = stats.ttest_rel(data["Algorithm A"], data["Algorithm B"])
+    _, p_value = stats.ttest_rel(values_a, values_b)
 
     # Determine the result based on the p-value
     alpha = 0.05
@@ -1,5 +1,79 @@
+from SAES.utils.file_cache import cache_path, save_cache
+
 from scipy.stats import shapiro
+from functools import lru_cache
 import pandas as pd
+import importlib.util
+import os
+
+# Largest sample for which the p-value of the Shapiro-Wilk test is accurate
+SHAPIRO_MAX_SIZE = 5000
+
+def read_csv(path: str) -> pd.DataFrame:
+    """
+    Reads a CSV file, caching the parsed DataFrame as a Parquet file between runs.
+
+    The cache entry is keyed on the path, modification time and size of the CSV file, so any
+    change to the file invalidates it. The cache is only used when pyarrow is installed and the
+    SAES_CACHE_DIR environment variable is set; otherwise the CSV file is parsed every time.
+    Within a run, the last files read are also kept in memory, so building the tables and plots
+    of several metrics from the same path parses it only once.
+
+    Args:
+        path (str):
+            Path to the CSV file.
+
+    Returns:
+        pd.DataFrame:
+            The DataFrame with the contents of the CSV file.
+
+    Example:
+        >>> from SAES.utils.dataframe_processor import read_csv
+        >>> 
+        >>> data = read_csv("experimentData.csv")
+    """
+
+    # The caller gets its own copy, so changes to it do not reach the DataFrame kept in memory
+    stat = os.stat(path)
+    return _read_csv_file(os.path.abspath(path), stat.st_mtime_ns, stat.st_size).copy()
+
+# Number of versions of CSV files kept in memory by the readers below. Each one holds a whole parsed file (or its split 
+# by metric), so only the data and metrics files of the last couple of experiments are kept
+CSV_CACHE_SIZE = 4
+
+@lru_cache(maxsize=CSV_CACHE_SIZE)
+def _read_csv_file(path: str, mtime_ns: int, size: int) -> pd.DataFrame:
+    """Parses a CSV file (or loads its Parquet cache), cached in memory for each version of the file."""
+
+    parquet_path = cache_path(path, "parquet")
+    if parquet_path is None or importlib.util.find_spec("pyarrow") is None:
+        return pd.read_csv(path, delimiter=",")
+
+    from pyarrow import ArrowException
+
+    # Load the cached DataFrame if the CSV file has not changed since it was cached
+    if os.path.exists(parquet_path):
+        try:
+            return pd.read_parquet(parquet_path)
+        except (OSError, ArrowException):
+            pass
+
+    data = pd.read_csv(path, delimiter=",")
+
+    # A cache that cannot be written is not an error, the CSV file is just parsed again next time
+    try:
+        save_cache(parquet_path, lambda file: data.to_parquet(file, index=False))
+    except (OSError, ArrowException):
+        pass
+
+    return data
+
+@lru_cache(maxsize=CSV_CACHE_SIZE)
+def _read_csv_metrics(path: str, mtime_ns: int, size: int) -> dict:
+    """Splits a parsed CSV file by metric in one pass, cached for each version of the file."""
+
+    data = _read_csv_file(path, mtime_ns, size)
+    return dict(tuple(data.groupby("MetricName", sort=False)))
 
 def get_metrics(data: pd.DataFrame) -> list:
     """
@@ -21,7 +95,8 @@ def check_normality(data: pd.DataFrame) -> bool:
     Check the normality of grouped data in a DataFrame using the Shapiro-Wilk test.
     This function groups the input data by the "Algorithm" and "Instance" columns, 
     and tests the normality of the "MetricValue" column within each group. It returns `False` 
-    if any group fails the normality test, and `True` otherwise.
+    if any group fails the normality test, and `True` otherwise. Groups larger than 5000 values
+    are tested on a fixed random sample of 5000 values, the largest size the test is accurate for.
     
     Args:
         data (pd.DataFrame): 
@@ -33,16 +108,19 @@ def check_normality(data: pd.DataFrame) -> bool:
     """
 
     # Group the data by Algorithm and Instance
-    grouped_data = data.groupby(["Algorithm", "Instance"])
+    grouped_data = data.groupby(["Algorithm", "Instance"], observed=True)["MetricValue"]
+
+    # Identical values imply non-normal distribution, as do groups too small to be tested, so every group is checked
+    # for them at once before running any test
+    summary = grouped_data.agg(["min", "max", "size"])
+    if ((summary["max"] == summary["min"]) | (summary["size"] < 3)).any():
+        return False
 
     # Perform the Shapiro-Wilk test for normality for each group
-    for _, group in grouped_data:
-        metric_values = group["MetricValue"]
-        if metric_values.max() == metric_values.min() or len(metric_values) < 3: 
-            # Identical values imply non-normal distribution
-            p_value = 0
-        else:
-            _, p_value = shapiro(metric_values)
+    for _, metric_values in grouped_data:
+        if len(metric_values) > SHAPIRO_MAX_SIZE:
+            metric_values = metric_values.sample(SHAPIRO_MAX_SIZE, random_state=0)
+        _, p_value = shapiro(metric_values)
             
         # If any group fails the normality test
         if p_value <= 0.05:
@@ -90,18 +168,27 @@ def process_dataframe_metric(data: str | pd.DataFrame, metrics: str | pd.DataFra
         >>> df_n, maximize = process_csv_metrics(experimentData, metrics, metric)
     """
 
-    # Load the data DataFrame, either from a CSV file or as an existing DataFrame
-    data = pd.read_csv(data, delimiter=",") if isinstance(data, str) else data
+    # Load the data of a CSV file already split by metric, or keep the existing DataFrame
+    if isinstance(data, str):
+        stat = os.stat(data)
+        file_version = (os.path.abspath(data), stat.st_mtime_ns, stat.st_size)
+        metric_rows = _read_csv_metrics(*file_version)
 
     # Load the metrics DataFrame, either from a CSV file or as an existing DataFrame
-    metrics = pd.read_csv(metrics, delimiter=",") if isinstance(metrics, str) else metrics
+    metrics = read_csv(metrics) if isinstance(metrics, str) else metrics
 
     try:
         # Retrieve the maximize flag (True/False) for the specified metric
         maximize = metrics[metrics["MetricName"] == metric]["Maximize"].values[0]
     
-        # Filter the data DataFrame for the rows matching the specified metric
-        data = data[data["MetricName"] == metric].reset_index()
+        # Filter the data DataFrame for the rows matching the specified metric (a lookup for CSV files)
+        if isinstance(data, str) and metric in metric_rows:
+            data = metric_rows[metric].reset_index()
+        elif isinstance(data, str):
+            # A metric with no rows in the data gets an empty DataFrame, as when filtering a DataFrame
+            data = _read_csv_file(*file_version).iloc[:0].reset_index()
+        else:
+            data = data[data["MetricName"] == metric].reset_index()
 
         # Return the filtered data and the maximize flag
         return data, maximize
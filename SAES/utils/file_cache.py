@@ -0,0 +1,93 @@
+import hashlib
+import re
+import os
+
+# Directory where the parsed files are cached between runs, only used when SAES_CACHE_DIR is set
+CACHE_DIR = os.environ.get("SAES_CACHE_DIR")
+
+# Largest number of files kept in CACHE_DIR, the least recently written ones being removed first
+CACHE_MAX_FILES = 64
+
+# Name of the files cached in CACHE_DIR: the key of the file path, then the key of its modification time and size
+_CACHE_NAME = re.compile(r"(?P<path>[0-9a-f]{16})-[0-9a-f]{16}\.(?P<extension>\w+)")
+
+def cache_path(path: str, extension: str) -> str | None:
+    """
+    Returns the path in CACHE_DIR of the cached copy of a file, keyed on its path, modification time and size.
+
+    Args:
+        path (str):
+            Path to the file to be cached.
+
+        extension (str):
+            Extension of the cached copy, which depends on its format (e.g. "npy" or "parquet").
+
+    Returns:
+        str | None:
+            The path of the cached copy, or None if SAES_CACHE_DIR is not set.
+
+    Example:
+        >>> from SAES.utils.file_cache import cache_path
+        >>>
+        >>> npy_path = cache_path("front.csv", "npy")
+    """
+
+    if CACHE_DIR is None:
+        return None
+
+    stat = os.stat(path)
+    path_key = hashlib.blake2b(os.path.abspath(path).encode()).hexdigest()[:16]
+    version_key = hashlib.blake2b(f"{stat.st_mtime_ns}|{stat.st_size}".encode()).hexdigest()[:16]
+    return os.path.join(CACHE_DIR, f"{path_key}-{version_key}.{extension}")
+
+def save_cache(path: str, save) -> None:
+    """
+    Writes a cached copy, then removes the copies of older versions of the same file and the least recently written 
+    files beyond CACHE_MAX_FILES.
+
+    Args:
+        path (str):
+            Path of the cached copy, as returned by `cache_path`.
+
+        save (Callable):
+            Function writing the cached copy to the open binary file it is given.
+
+    Returns:
+        None
+
+    Example:
+        >>> from SAES.utils.file_cache import cache_path, save_cache
+        >>> import numpy as np
+        >>>
+        >>> front = np.loadtxt("front.csv", delimiter=",")
+        >>> save_cache(cache_path("front.csv", "npy"), lambda file: np.save(file, front))
+    """
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    # Write to a temporary file first, so other processes never load a partially written copy
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(temp_path, "wb") as file:
+            save(file)
+        os.replace(temp_path, path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+    # Split the other cached copies into the ones of older versions of the same file and the rest
+    key = _CACHE_NAME.fullmatch(os.path.basename(path)).group("path", "extension")
+    stale, entries = [], []
+    for entry in os.scandir(os.path.dirname(path)):
+        name = _CACHE_NAME.fullmatch(entry.name)
+        if name is not None and entry.path != path:
+            (stale if name.group("path", "extension") == key else entries).append(entry)
+
+    # The copy just written is always kept, along with the most recently written ones
+    entries.sort(key=lambda entry: entry.stat().st_mtime_ns, reverse=True)
+    for entry in stale + entries[CACHE_MAX_FILES - 1:]:
+        # Another process may have removed it already
+        try:
+            os.remove(entry.path)
+        except FileNotFoundError:
+            pass
@@ -1,7 +1,9 @@
 from SAES.latex_generation.stats_table import MeanMedian, Friedman, WilcoxonPivot, Wilcoxon, Anova, TTest, TTestPivot, FriedmanPValues
 import pandas.testing as pdt
+from unittest.mock import patch
 import unittest, os
 import pandas as pd
+import numpy as np
 
 class TestTableClasses(unittest.TestCase):
     
@@ -41,6 +43,14 @@ class TestTableClasses(unittest.TestCase):
         self.assertAlmostEqual(median.table.loc["I2", "A1"], 0.2, places=2)
         self.assertAlmostEqual(median.table.loc["I2", "A2"], 7.05, places=2)
 
+    def test_lazy_normality(self):
+        with patch("SAES.latex_generation.stats_table.check_normality", return_value=True) as check_normality:
+            median = MeanMedian(self.data_diff, self.metrics, self.metric)
+            median.compute_table()
+            check_normality.assert_not_called()
+            self.assertTrue(median.normality)
+            check_normality.assert_called_once()
+
     def test_friedman_difference(self):
         friedman = Friedman(self.data_diff, self.metrics, self.metric)
         friedman.compute_table()
@@ -61,6 +71,13 @@ class TestTableClasses(unittest.TestCase):
         self.assertEqual(wilcoxon_pivot.table.loc["I1", "A1"][1], "+")
         self.assertAlmostEqual(wilcoxon_pivot.table.loc["I1", "A2"][0], 5.0, places=2)
         self.assertEqual(wilcoxon_pivot.table.loc["I1", "A2"][1], "")
+
+    def test_wilcoxon_pivot_arrays(self):
+        wilcoxon_pivot = WilcoxonPivot(self.data_diff, self.metrics, self.metric)
+        wilcoxon_pivot.compute_table()
+        self.assertEqual(wilcoxon_pivot.scores.dtype, float)
+        self.assertTrue(all(result == "" for result in wilcoxon_pivot.test_results[:, -1]))
+        self.assertEqual(wilcoxon_pivot.table.iloc[0, 0], (wilcoxon_pivot.scores[0, 0], wilcoxon_pivot.test_results[0, 0]))
     
     def test_wilcoxon_pivot_no_difference(self):
         wilcoxon_pivot = WilcoxonPivot(self.data_no_diff, self.metrics, self.metric)
@@ -70,6 +87,12 @@ class TestTableClasses(unittest.TestCase):
         self.assertAlmostEqual(wilcoxon_pivot.table.loc["I1", "A1"][0], 0.15, places=2)
         self.assertEqual(wilcoxon_pivot.table.loc["I1", "A1"][1], "=")
     
+    def test_instance_values(self):
+        wilcoxon_pivot = WilcoxonPivot(self.data_no_diff, self.metrics, self.metric)
+        values = wilcoxon_pivot.instance_values()
+        self.assertEqual(values.shape, (2, 2, 3))
+        self.assertEqual(list(values[1, :, 2]), [14, 15])
+
     def test_wilcoxon_difference(self):
         wilcoxon = Wilcoxon(self.data_diff, self.metrics, self.metric)
         wilcoxon.compute_table()
@@ -83,6 +106,47 @@ class TestTableClasses(unittest.TestCase):
         self.assertEqual(wilcoxon.table.loc["A2", "A3"], "==")
         self.assertEqual(wilcoxon.table.loc["A2", "A2"], "")
 
+    def test_wilcoxon_parallel(self):
+        wilcoxon = Wilcoxon(self.swarmIntelligence, self.multiobjectiveMetrics, "HV")
+        wilcoxon.compute_table()
+        with patch("SAES.latex_generation.stats_table.PARALLEL_MIN_TESTS", 0):
+            wilcoxon_parallel = Wilcoxon(pd.read_csv(self.swarmIntelligence), pd.read_csv(self.multiobjectiveMetrics), "HV")
+            wilcoxon_parallel.compute_table()
+        pdt.assert_frame_equal(wilcoxon.table, wilcoxon_parallel.table)
+
+    def test_friedman_p_values_parallel(self):
+        friedman = FriedmanPValues(self.swarmIntelligence, self.multiobjectiveMetrics, "HV")
+        friedman.compute_table()
+        with patch("SAES.latex_generation.stats_table.PARALLEL_MIN_TESTS", 0):
+            friedman_parallel = FriedmanPValues(pd.read_csv(self.swarmIntelligence), pd.read_csv(self.multiobjectiveMetrics), "HV")
+            friedman_parallel.compute_table()
+        pdt.assert_frame_equal(friedman.table, friedman_parallel.table)
+
+    def test_parallel_unknown_cpu_count(self):
+        wilcoxon = Wilcoxon(self.swarmIntelligence, self.multiobjectiveMetrics, "HV")
+        wilcoxon.compute_table()
+        with patch("SAES.latex_generation.stats_table.PARALLEL_MIN_TESTS", 0), \
+             patch("SAES.latex_generation.stats_table.os.cpu_count", return_value=None):
+            wilcoxon_parallel = Wilcoxon(pd.read_csv(self.swarmIntelligence), pd.read_csv(self.multiobjectiveMetrics), "HV")
+            wilcoxon_parallel.compute_table()
+        pdt.assert_frame_equal(wilcoxon.table, wilcoxon_parallel.table)
+
+    def test_parallel_in_worker_process(self):
+        # Tables built in a worker process (e.g. a metric of the CLI) run their tests there, without a nested pool
+        with patch("SAES.latex_generation.stats_table.PARALLEL_MIN_TESTS", 0), \
+             patch("SAES.latex_generation.stats_table.multiprocessing.parent_process", return_value=object()), \
+             patch("SAES.latex_generation.stats_table.ProcessPoolExecutor") as executor:
+            Wilcoxon(pd.read_csv(self.swarmIntelligence), pd.read_csv(self.multiobjectiveMetrics), "HV").compute_table()
+            executor.assert_not_called()
+
+    def test_friedman_parallel_fails_fast(self):
+        data = self.data_no_diff.drop(index=0)
+        with patch("SAES.latex_generation.stats_table.PARALLEL_MIN_TESTS", 0), \
+             patch("SAES.latex_generation.stats_table.ProcessPoolExecutor") as executor:
+            with self.assertRaises(ValueError):
+                Friedman(data, self.metrics, self.metric).compute_table()
+            executor.assert_not_called()
+
     def test_mean_median_table(self):
         mean_median = MeanMedian(self.swarmIntelligence, self.multiobjectiveMetrics, "HV")
         mean_median.compute_table()
@@ -279,6 +343,58 @@ class TestTableClasses(unittest.TestCase):
         ttest.show()
         self.assertTrue(True)
 
+    def test_shared_metric_context(self):
+        mean_median = MeanMedian(self.swarmIntelligence, self.multiobjectiveMetrics, "HV")
+        friedman = Friedman(self.swarmIntelligence, self.multiobjectiveMetrics, "HV")
+
+        # Tables built from the same CSV files share the processed data
+        self.assertIs(mean_median.data, friedman.data)
+        self.assertEqual(mean_median.normality, friedman.normality)
+        self.assertEqual(list(mean_median.instances), list(friedman.instances))
+
+    def test_modified_dataframe(self):
+        data = pd.read_csv(self.swarmIntelligence)
+        metrics = pd.read_csv(self.multiobjectiveMetrics)
+        mean_median = MeanMedian(data, metrics, "HV")
+        mean_median.compute_table()
+
+        # Tables built after modifying the DataFrames in place see the new values
+        data["MetricValue"] *= 2
+        metrics.loc[metrics["MetricName"] == "HV", "Maximize"] = False
+        doubled = MeanMedian(data, metrics, "HV")
+        doubled.compute_table()
+        pdt.assert_frame_equal(doubled.table, mean_median.table * 2)
+        self.assertFalse(doubled.maximize)
+
+    def test_shared_base_table(self):
+        mean_median = MeanMedian(self.swarmIntelligence, self.multiobjectiveMetrics, "HV")
+        wilcoxon_pivot = WilcoxonPivot(self.swarmIntelligence, self.multiobjectiveMetrics, "HV")
+        mean_median.compute_base_table()
+        wilcoxon_pivot.compute_base_table()
+
+        # The base table is computed once for the shared data, but every table gets its own copy
+        pdt.assert_frame_equal(mean_median.mean_median, wilcoxon_pivot.mean_median)
+        pdt.assert_frame_equal(mean_median.std_iqr, wilcoxon_pivot.std_iqr)
+        self.assertIsNot(mean_median.mean_median, wilcoxon_pivot.mean_median)
+
+        mean_median.mean_median.iloc[0, 0] = np.nan
+        self.assertFalse(np.isnan(wilcoxon_pivot.mean_median.iloc[0, 0]))
+
+    def test_shared_test_results(self):
+        wilcoxon_pivot = WilcoxonPivot(self.swarmIntelligence, self.multiobjectiveMetrics, "HV")
+        wilcoxon_pivot.compute_table()
+        other_pivot = WilcoxonPivot(self.swarmIntelligence, self.multiobjectiveMetrics, "HV")
+        other_pivot.compute_table()
+        self.assertIs(wilcoxon_pivot.test_results, other_pivot.test_results)
+        self.assertFalse(wilcoxon_pivot.test_results.flags.writeable)
+
+    def test_shared_instance_values(self):
+        friedman = Friedman(self.swarmIntelligence, self.multiobjectiveMetrics, "HV")
+        wilcoxon_pivot = WilcoxonPivot(self.swarmIntelligence, self.multiobjectiveMetrics, "HV")
+
+        # The per-instance values are pivoted once for the shared data
+        self.assertIs(friedman.instance_values(), wilcoxon_pivot.instance_values())
+
 
 
 
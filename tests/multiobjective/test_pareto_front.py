@@ -1,6 +1,10 @@
-from SAES.multiobjective.pareto_front import Front2D, Front3D, FrontND
+from SAES.multiobjective.pareto_front import Front2D, Front3D, FrontND, _read_front, _read_fronts, _read_front_file
+from unittest.mock import patch
 from PIL import Image
-import unittest, os
+import matplotlib.pyplot as plt
+import numpy as np
+import unittest, tempfile, os
+import pytest
 
 class TestParetoFront(unittest.TestCase):
     
@@ -59,3 +63,93 @@ class TestParetoFront(unittest.TestCase):
     def test_shownd(self):
         self.frontnd.show("DTLZ1")
         self.assertTrue(True)
+
+    def test_missing_front(self):
+        figures = plt.get_fignums()
+        with self.assertRaises(FileNotFoundError):
+            self.front2d.show("Missing")
+        self.assertEqual(plt.get_fignums(), figures)
+
+    def test_read_fronts_unknown_cpu_count(self):
+        front_path = "tests/test_data/references/DTLZ1.2D.csv"
+        with patch("SAES.multiobjective.pareto_front.os.cpu_count", return_value=None):
+            fronts = _read_fronts([front_path, front_path])
+        self.assertIs(fronts[0], fronts[1])
+
+    def test_read_front(self):
+        with tempfile.TemporaryDirectory() as folder:
+            front_path = os.path.join(folder, "front.csv")
+            with open(front_path, "w") as file:
+                file.write("0.5,1.5\n1.0,0.5\n")
+            front = _read_front(front_path)
+            self.assertEqual(front.shape, (2, 2))
+            self.assertTrue(front[0].flags.c_contiguous)
+            self.assertIs(_read_front(front_path), front)
+
+            # A modified file is read again
+            with open(front_path, "w") as file:
+                file.write("0.5,1.5\n")
+            os.utime(front_path, ns=(os.stat(front_path).st_atime_ns, os.stat(front_path).st_mtime_ns + 1))
+            self.assertEqual(_read_front(front_path).shape, (2, 1))
+
+    def test_read_front_pyarrow(self):
+        pytest.importorskip("pyarrow")
+        front_paths = sorted(
+            os.path.join(folder, file) for folder, _, files in os.walk("tests/test_data")
+            for file in files if folder.startswith("tests/test_data/references") or file.endswith("_FUN.csv")
+        )
+
+        # Both parsers return the same values, bit for bit
+        for front_path in front_paths:
+            _read_front_file.cache_clear()
+            front = _read_front(front_path)
+            _read_front_file.cache_clear()
+            with patch("SAES.multiobjective.pareto_front.importlib.util.find_spec", return_value=None):
+                np.testing.assert_array_equal(_read_front(front_path), front)
+        _read_front_file.cache_clear()
+
+    def test_read_front_not_saved(self):
+        front_path = "tests/test_data/references/DTLZ1.2D.csv"
+        with patch("SAES.utils.file_cache.CACHE_DIR", None), \
+             patch("SAES.multiobjective.pareto_front.save_cache") as save_cache, \
+             patch("SAES.multiobjective.pareto_front.np.save") as np_save:
+            _read_front_file.cache_clear()
+            _read_front(front_path)
+            _read_front_file.cache_clear()
+            save_cache.assert_not_called()
+            np_save.assert_not_called()
+
+    def test_read_front_saved(self):
+        front_path = "tests/test_data/references/DTLZ1.2D.csv"
+        with tempfile.TemporaryDirectory() as cache_dir, patch("SAES.utils.file_cache.CACHE_DIR", cache_dir):
+            _read_front_file.cache_clear()
+            front = _read_front(front_path)
+            self.assertEqual(len(os.listdir(cache_dir)), 1)
+
+            # A new session loads the saved front instead of parsing the CSV file
+            _read_front_file.cache_clear()
+            with patch("SAES.multiobjective.pareto_front.pd.read_csv") as read_csv:
+                np.testing.assert_array_equal(_read_front(front_path), front)
+                read_csv.assert_not_called()
+            _read_front_file.cache_clear()
+
+    def test_read_front_pruned(self):
+        with tempfile.TemporaryDirectory() as folder, tempfile.TemporaryDirectory() as cache_dir, \
+                patch("SAES.utils.file_cache.CACHE_DIR", cache_dir), \
+                patch("SAES.utils.file_cache.CACHE_MAX_FILES", 2):
+            front_paths = [os.path.join(folder, f"front{i}.csv") for i in range(3)]
+            for front_path in front_paths:
+                with open(front_path, "w") as file:
+                    file.write("0.5,1.5\n1.0,0.5\n")
+
+            # The front saved for the previous version of a file is removed
+            _read_front(front_paths[0])
+            os.utime(front_paths[0], ns=(os.stat(front_paths[0]).st_atime_ns, os.stat(front_paths[0]).st_mtime_ns + 1))
+            _read_front(front_paths[0])
+            self.assertEqual(len(os.listdir(cache_dir)), 1)
+
+            # Only the most recently saved fronts are kept
+            _read_front(front_paths[1])
+            _read_front(front_paths[2])
+            self.assertEqual(len(os.listdir(cache_dir)), 2)
+            _read_front_file.cache_clear()
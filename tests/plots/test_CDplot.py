@@ -1,5 +1,7 @@
-from SAES.plots.cdplot import CDplot
+from SAES.plots.cdplot import CDplot, _join_alg
 from PIL import Image
+import pandas as pd
+import numpy as np
 import unittest, os
 
 class TestCDplot(unittest.TestCase):
@@ -22,6 +24,26 @@ class TestCDplot(unittest.TestCase):
 
         os.remove(image_path)
 
+    def test_save_tied(self):
+        data = pd.DataFrame({
+            "Algorithm": ["A", "B", "C"] * 4,
+            "Instance": [f"I{i}" for i in range(4) for _ in range(3)],
+            "MetricName": "M",
+            "ExecutionId": 0,
+            "MetricValue": 1.0
+        })
+        metrics = pd.DataFrame({"MetricName": ["M"], "Maximize": [True]})
+        CDplot(data, metrics, "M").save(f"{os.getcwd()}/tests/plots", file_name="cdplot_tied.png")
+        image_path = f"{os.getcwd()}/tests/plots/cdplot_tied.png"
+        self.assertTrue(os.path.exists(image_path))
+        os.remove(image_path)
+
     def test_show(self):
         self.cdplot.show(width=10)
         self.assertTrue(True)
+
+    def test_join_alg(self):
+        avranks = np.array([1.0, 1.5, 3.0, 3.2, 5.0])
+        np.testing.assert_array_equal(_join_alg(avranks, 5, 1.0), [[1.0, 1.5], [3.0, 3.2]])
+        np.testing.assert_array_equal(_join_alg(avranks, 5, 4.5), [1.0, 5.0])
+        self.assertEqual(_join_alg(avranks, 5, 0.1).size, 0)
@@ -1,5 +1,8 @@
 from SAES.plots.histoplot import HistoPlot
+from unittest.mock import patch
 from PIL import Image
+import matplotlib.pyplot as plt
+import pandas as pd
 import unittest, os
 
 class TestHistoPlot(unittest.TestCase):
@@ -41,3 +44,15 @@ class TestHistoPlot(unittest.TestCase):
     def test_show_all_instances(self):
         self.histoPlot.show_all_instances(width=20)
         self.assertTrue(True)
+
+    def test_algorithm_without_rows(self):
+        data = pd.read_csv("tests/test_data/swarmIntelligence.csv")
+        algorithm = data["Algorithm"].iloc[0]
+        data = data[~((data["Algorithm"] == algorithm) & (data["Instance"] == "ZDT1"))]
+        histoPlot = HistoPlot(data, pd.read_csv("tests/test_data/multiobjectiveMetrics.csv"), "HV")
+
+        # The algorithm is left out of the instance it has no rows for, keeping its color for the other algorithms
+        for show in (lambda: histoPlot.show_instance("ZDT1", width=10), lambda: histoPlot.show_all_instances(width=20)):
+            with patch("SAES.plots.histoplot.plt.show"):
+                show()
+            plt.close("all")
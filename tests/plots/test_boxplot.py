@@ -1,5 +1,7 @@
 from SAES.plots.boxplot import Boxplot
+from unittest.mock import patch
 from PIL import Image
+import matplotlib.pyplot as plt
 import unittest, os
 
 class TestBoxplot(unittest.TestCase):
@@ -41,3 +43,20 @@ class TestBoxplot(unittest.TestCase):
     def test_show_all_instances(self):
         self.boxplot.show_all_instances(width=20)
         self.assertTrue(True)
+
+    def test_metric_values(self):
+        values = self.boxplot._metric_values
+        self.assertEqual(list(values), list(self.boxplot.instances))
+        zdt1 = self.boxplot.data[self.boxplot.data["Instance"] == "ZDT1"]
+        self.assertEqual(list(values["ZDT1"]), list(zdt1["Algorithm"].unique()))
+        for algorithm, metric_values in values["ZDT1"].items():
+            self.assertEqual(list(metric_values), list(zdt1[zdt1["Algorithm"] == algorithm]["MetricValue"]))
+
+    def test_show_instance_missing(self):
+        # An instance missing from the data is drawn as empty axes, without raising
+        with patch("SAES.plots.boxplot.plt.show"):
+            self.boxplot.show_instance("Missing")
+        axes = plt.gca()
+        self.assertEqual(len(axes.lines), 0)
+        self.assertIn("Missing", axes.get_title())
+        plt.close("all")
@@ -1,5 +1,6 @@
-from SAES.statistical_tests.non_parametrical import friedman, wilcoxon, NemenyiCD, friedman_aligned_rank, quade
+from SAES.statistical_tests.non_parametrical import friedman, wilcoxon, NemenyiCD, friedman_aligned_rank, quade, ranks
 import pandas as pd
+import numpy as np
 import unittest
 
 class TestStatisticalTests(unittest.TestCase):
@@ -44,6 +45,11 @@ class TestStatisticalTests(unittest.TestCase):
         result = wilcoxon(self.wilcoxon_data_different, maximize=True)
         self.assertIn(result, ["+", "-"])  # It will be depend of the medians
 
+    def test_wilcoxon_test_array(self):
+
+        result = wilcoxon(self.wilcoxon_data_different.values, maximize=True)
+        self.assertEqual(result, wilcoxon(self.wilcoxon_data_different, maximize=True))
+
     def test_wilcoxon_test_raises(self):
        
         with self.assertRaises(KeyError):
@@ -77,4 +83,16 @@ class TestStatisticalTests(unittest.TestCase):
     def test_quade_test_raises(self):
         
         with self.assertRaises(ValueError):
-            quade(pd.DataFrame(), maximize=True)  # No data
\ No newline at end of file
+            quade(pd.DataFrame(), maximize=True)  # No data
+
+    def test_ranks(self):
+
+        data = np.array([[0.5, 0.9, 0.5, 0.1], [3.0, 1.0, 2.0, 2.0]])
+        np.testing.assert_array_equal(ranks(data, maximize=True), [[2.5, 1, 2.5, 4], [1, 4, 2.5, 2.5]])
+        np.testing.assert_array_equal(ranks(data, maximize=False), [[2.5, 4, 2.5, 1], [4, 1, 2.5, 2.5]])
+        np.testing.assert_array_equal(ranks(data[0], maximize=False), [2.5, 4, 2.5, 1])
+
+    def test_ranks_raises(self):
+
+        with self.assertRaises(ValueError):
+            ranks(np.array([0.5, np.nan]), maximize=True)
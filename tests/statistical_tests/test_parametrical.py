@@ -44,6 +44,11 @@ class TestStatisticalTests(unittest.TestCase):
         result = t_test(self.ttest_data_different, maximize=True)
         self.assertIn(result, ["+", "-"])  # It will be depend of the medians
 
+    def test_t_test_array(self):
+
+        result = t_test(self.ttest_data_different.values, maximize=True)
+        self.assertEqual(result, t_test(self.ttest_data_different, maximize=True))
+
     def test_t_test_raises(self):
        
         with self.assertRaises(KeyError):
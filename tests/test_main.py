@@ -0,0 +1,63 @@
+from concurrent.futures import ProcessPoolExecutor
+from unittest.mock import patch
+import SAES.__main__ as cli
+import pandas as pd
+import unittest, tempfile, os
+
+class TestMain(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        self.addCleanup(self.folder.cleanup)
+
+        # A smaller dataset with two metrics, so every metric is run without making the tests slow
+        data = pd.read_csv("tests/test_data/swarmIntelligence.csv")
+        instances = data["Instance"].unique()[:3]
+        data = data[data["MetricName"].isin(["HV", "EP"]) & data["Instance"].isin(instances)]
+        self.data = os.path.join(self.folder.name, "data.csv")
+        data.to_csv(self.data, index=False)
+        self.metrics = "tests/test_data/multiobjectiveMetrics.csv"
+        self.output = os.path.join(self.folder.name, "output")
+
+    def run_main(self, *args: str) -> ProcessPoolExecutor:
+        """Runs the CLI with the given options on the dataset, returning the spy of the per-metric worker pool."""
+
+        argv = ["SAES", *args, "-ds", self.data, "-ms", self.metrics, "-op", self.output]
+        with patch("sys.argv", argv), patch.dict(os.environ), \
+             patch("SAES.__main__.ProcessPoolExecutor", wraps=ProcessPoolExecutor) as executor:
+            cli.main()
+        return executor
+
+    def output_files(self) -> list:
+        """Returns the files generated in the output folder, including its subfolders."""
+        return sorted(file for _, _, files in os.walk(self.output) for file in files)
+
+    def test_latex_all_metrics(self):
+        executor = self.run_main("-ls", "-s", "mean_median")
+        executor.assert_called_once()
+        self.assertEqual(self.output_files(), ["MeanMedian_EP.tex", "MeanMedian_HV.tex"])
+
+    def test_latex_metric(self):
+        executor = self.run_main("-ls", "-s", "mean_median", "-m", "HV")
+        executor.assert_not_called()
+        self.assertEqual(self.output_files(), ["MeanMedian_HV.tex"])
+
+    def test_boxplot_all_metrics(self):
+        executor = self.run_main("-bp")
+        executor.assert_called_once()
+        self.assertEqual(self.output_files(), ["boxplot_EP_all.png", "boxplot_HV_all.png"])
+
+    def test_boxplot_grid_by_default(self):
+        # Without an instance, the boxplots of every instance are generated in a grid
+        self.run_main("-bp", "-m", "HV")
+        self.assertEqual(self.output_files(), ["boxplot_HV_all.png"])
+
+    def test_boxplot_instance(self):
+        instance = pd.read_csv(self.data)["Instance"].iloc[0]
+        self.run_main("-bp", "-m", "HV", "-i", instance)
+        self.assertEqual(self.output_files(), [f"boxplot_HV_{instance}.png"])
+
+    def test_cdplot_all_metrics(self):
+        executor = self.run_main("-cdp")
+        executor.assert_called_once()
+        self.assertEqual(self.output_files(), ["cdplot_EP.png", "cdplot_HV.png"])
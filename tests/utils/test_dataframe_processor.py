@@ -1,6 +1,8 @@
-from SAES.utils.dataframe_processor import process_dataframe_metric, check_normality, get_metrics
+from SAES.utils.dataframe_processor import process_dataframe_metric, check_normality, get_metrics, read_csv, _read_csv_file
+from unittest.mock import patch
 import pandas as pd
-import unittest
+import unittest, tempfile, os
+import pytest
 
 class TestBoxplot(unittest.TestCase):
     
@@ -14,10 +16,65 @@ class TestBoxplot(unittest.TestCase):
         self.assertAlmostEqual(processed[0].loc[3, "MetricValue"], 0.643772, 2)
         self.assertTrue(processed[1])
 
+    def test_process_dataframe_metric_csv(self):
+        data, maximize = process_dataframe_metric("tests/test_data/swarmIntelligence.csv", self.multiobjectiveMetrics, self.metric)
+        expected, _ = process_dataframe_metric(self.swarmIntelligence, self.multiobjectiveMetrics, self.metric)
+        pd.testing.assert_frame_equal(data, expected)
+        self.assertTrue(maximize)
+
     def test_check_normality(self):
         self.assertFalse(check_normality(self.swarmIntelligence))
 
+    def test_check_normality_constant_group(self):
+        data = pd.DataFrame({
+            "Algorithm": ["A"] * 4 + ["B"] * 4,
+            "Instance": ["I"] * 8,
+            "MetricValue": [0.1, 0.2, 0.3, 0.25, 0.5, 0.5, 0.5, 0.5]
+        })
+        self.assertFalse(check_normality(data))
+        self.assertTrue(check_normality(data.iloc[:4]))
+
     def test_get_metrics(self):
         metrics = list(get_metrics(self.swarmIntelligence))
         metrics_og = list(self.multiobjectiveMetrics["MetricName"].unique())
         self.assertEqual(metrics, metrics_og) 
+
+    def test_read_csv(self):
+        data = read_csv("tests/test_data/swarmIntelligence.csv")
+        pd.testing.assert_frame_equal(data, self.swarmIntelligence)
+        pd.testing.assert_frame_equal(read_csv("tests/test_data/swarmIntelligence.csv"), data)
+
+    def test_read_csv_copy(self):
+        data = read_csv("tests/test_data/swarmIntelligence.csv")
+        data["MetricValue"] = 0
+        pd.testing.assert_frame_equal(read_csv("tests/test_data/swarmIntelligence.csv"), self.swarmIntelligence)
+
+    def test_read_csv_parquet_cache(self):
+        pytest.importorskip("pyarrow")
+        path = "tests/test_data/swarmIntelligence.csv"
+        with tempfile.TemporaryDirectory() as cache_dir, patch("SAES.utils.file_cache.CACHE_DIR", cache_dir):
+            _read_csv_file.cache_clear()
+            data = read_csv(path)
+            self.assertEqual(len(os.listdir(cache_dir)), 1)
+
+            # A new session loads the Parquet file instead of parsing the CSV file
+            _read_csv_file.cache_clear()
+            with patch("SAES.utils.dataframe_processor.pd.read_csv") as pandas_read_csv:
+                pd.testing.assert_frame_equal(read_csv(path), data)
+                pandas_read_csv.assert_not_called()
+
+            # A corrupted Parquet file is replaced by parsing the CSV file again
+            cache_path = os.path.join(cache_dir, os.listdir(cache_dir)[0])
+            with open(cache_path, "wb") as file:
+                file.write(b"not parquet")
+            _read_csv_file.cache_clear()
+            pd.testing.assert_frame_equal(read_csv(path), data)
+            _read_csv_file.cache_clear()
+
+    def test_process_dataframe_metric_csv_no_rows(self):
+        metrics = pd.concat([self.multiobjectiveMetrics, pd.DataFrame({"MetricName": ["Missing"], "Maximize": [False]})])
+        data, maximize = process_dataframe_metric("tests/test_data/swarmIntelligence.csv", metrics, "Missing")
+        expected, _ = process_dataframe_metric(self.swarmIntelligence, metrics, "Missing")
+        pd.testing.assert_frame_equal(data, expected)
+        self.assertTrue(data.empty)
+        self.assertFalse(maximize)
@@ -0,0 +1,38 @@
+from SAES.utils.file_cache import cache_path, save_cache
+from unittest.mock import patch
+import unittest, tempfile, os
+
+class TestFileCache(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        self.addCleanup(self.folder.cleanup)
+        self.path = os.path.join(self.folder.name, "data.csv")
+        with open(self.path, "w") as file:
+            file.write("0.5,1.5\n")
+
+    def test_cache_path_disabled(self):
+        with patch("SAES.utils.file_cache.CACHE_DIR", None):
+            self.assertIsNone(cache_path(self.path, "npy"))
+
+    def test_cache_path_version(self):
+        with patch("SAES.utils.file_cache.CACHE_DIR", self.folder.name):
+            path = cache_path(self.path, "npy")
+            self.assertEqual(os.path.dirname(path), self.folder.name)
+            self.assertTrue(path.endswith(".npy"))
+
+            # A modified file gets a new cached copy
+            os.utime(self.path, ns=(os.stat(self.path).st_atime_ns, os.stat(self.path).st_mtime_ns + 1))
+            self.assertNotEqual(cache_path(self.path, "npy"), path)
+
+    def test_save_cache(self):
+        with tempfile.TemporaryDirectory() as cache_dir, patch("SAES.utils.file_cache.CACHE_DIR", cache_dir):
+            path = cache_path(self.path, "bin")
+            save_cache(path, lambda file: file.write(b"cached"))
+            with open(path, "rb") as file:
+                self.assertEqual(file.read(), b"cached")
+
+            # The copy of the previous version is removed, and no temporary file is left behind
+            os.utime(self.path, ns=(os.stat(self.path).st_atime_ns, os.stat(self.path).st_mtime_ns + 1))
+            save_cache(cache_path(self.path, "bin"), lambda file: file.write(b"cached"))
+            self.assertEqual(os.listdir(cache_dir), [os.path.basename(cache_path(self.path, "bin"))])